@@ -21,25 +21,224 @@ Usage:
 """
 
 import argparse
+import atexit
+import hashlib
+import json
 import logging
+import logging.handlers
+import os
+import queue
+import shutil
 import sys
+import threading
 import time
+from email.utils import formatdate, parsedate_to_datetime
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Tuple
+from typing import Dict, List, Optional, Tuple
 
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
+# Configure logging. Download threads only enqueue records; a single
+# listener thread formats them and writes to stderr, keeping console I/O
+# and the handler lock out of the download path
+_log_handler = logging.StreamHandler()
+_log_handler.setFormatter(logging.Formatter(
+    fmt='%(asctime)s - %(levelname)s - %(message)s',
     datefmt='%Y-%m-%d %H:%M:%S'
-)
+))
+_log_queue = queue.SimpleQueue()
+_log_listener = logging.handlers.QueueListener(_log_queue, _log_handler)
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
+logging.root.addHandler(logging.handlers.QueueHandler(_log_queue))
+logging.root.setLevel(logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+def write_stream(source, path: Path, append: bool = False) -> None:
+    """
+    Copy a response stream to a file in 1 MiB blocks and sync it to disk.
+
+    The file is flagged for sequential access (where supported) and
+    fdatasync'd before returning, so a .part file renamed into place
+    afterwards is never a partially flushed file after a crash.
+
+    Args:
+        source: Readable binary stream (e.g. response.raw)
+        path: File to write
+        append: Append to the file instead of truncating it
+    """
+    with open(path, 'ab' if append else 'wb') as f:
+        # Advice values are not flags and can't be combined; DONTNEED is
+        # deliberately not used since 04_parse_data.py reads these files next
+        if hasattr(os, 'posix_fadvise'):
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        shutil.copyfileobj(source, f, length=1024 * 1024)
+        f.flush()
+        if hasattr(os, 'fdatasync'):
+            os.fdatasync(f.fileno())
+        else:
+            os.fsync(f.fileno())
+
+
+def apply_last_modified(path: Path, response: requests.Response) -> None:
+    """
+    Set a downloaded file's mtime to the server's Last-Modified time.
+
+    Later If-Modified-Since checks based on the file's mtime then compare
+    the server's own timestamps rather than the local download time.
+
+    Args:
+        path: Downloaded file
+        response: Response the file was downloaded from
+    """
+    try:
+        modified = parsedate_to_datetime(response.headers['Last-Modified']).timestamp()
+    except (KeyError, TypeError, ValueError):
+        return
+    os.utime(path, (time.time(), modified))
+
+
+def create_session(pool_maxsize: int = 32) -> requests.Session:
+    """
+    Create a requests session with retry logic.
+
+    Args:
+        pool_maxsize: Keep-alive connections to pool for the download host
+
+    Returns:
+        Configured session
+    """
+    session = requests.Session()
+
+    # Short backoff (0.5s, 1s, 2s) so a flaky file costs seconds rather
+    # than a minute; 429/503 wait as long as the server's Retry-After asks.
+    # The final error response is returned (not raised) so its status
+    # reaches the HTTPError handling in download_job
+    retry_strategy = Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=["HEAD", "GET"],
+        respect_retry_after_header=True,
+        raise_on_status=False
+    )
+
+    # All downloads go to one host, so keep enough pooled keep-alive
+    # connections for every worker to reuse its TLS connection
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=pool_maxsize,
+        max_retries=retry_strategy
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+
+    # Set user agent; the CSVs compress well, so ask for gzip/deflate
+    # transfer encoding explicitly (decoded again while streaming), and keep
+    # connections open for reuse by later quarters
+    session.headers.update({
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+        'Accept-Encoding': 'gzip, deflate',
+        'Connection': 'keep-alive'
+    })
+
+    return session
+
+
+# Sessions shared by every downloader in this process, keyed by pool size,
+# so repeated use (notebooks, orchestrators) keeps connections warm instead
+# of paying pool setup and TLS handshakes per instance
+_SHARED_SESSIONS: Dict[int, requests.Session] = {}
+_SHARED_SESSIONS_LOCK = threading.Lock()
+
+
+def get_shared_session(pool_maxsize: int = 32) -> requests.Session:
+    """
+    Get the process-wide session for a connection pool size, creating it on first use.
+
+    Args:
+        pool_maxsize: Keep-alive connections to pool for the download host
+
+    Returns:
+        Shared session (closed automatically at interpreter exit)
+    """
+    with _SHARED_SESSIONS_LOCK:
+        session = _SHARED_SESSIONS.get(pool_maxsize)
+        if session is None:
+            session = _SHARED_SESSIONS[pool_maxsize] = create_session(pool_maxsize)
+        return session
+
+
+@atexit.register
+def close_shared_sessions() -> None:
+    """Close all shared sessions and release their pooled connections."""
+    with _SHARED_SESSIONS_LOCK:
+        for session in _SHARED_SESSIONS.values():
+            session.close()
+        _SHARED_SESSIONS.clear()
+
+
+class RangeNotHonored(Exception):
+    """The server answered a Range request with something other than that range."""
+
+
+@dataclass(frozen=True)
+class QuarterJob:
+    """A quarter to download, with its filename, URL and local path resolved."""
+
+    year: int
+    quarter: int
+    filename: str
+    url: str
+    output_path: Path
+
+
+class RateLimiter:
+    """
+    Sliding-window rate limiter shared by download threads.
+
+    Allows bursts of up to max_requests within any window of period seconds,
+    sleeping only when the window is full, rather than pausing a fixed
+    interval after every request.
+    """
+
+    def __init__(self, max_requests: int, period: float):
+        """
+        Args:
+            max_requests: Requests allowed within one window
+            period: Window length in seconds (0 disables limiting)
+        """
+        self.max_requests = max(1, max_requests)
+        self.period = period
+        self._starts = deque()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until another request may start, then record its start time."""
+        if self.period <= 0:
+            return
+
+        with self._lock:
+            now = time.monotonic()
+            while self._starts and now - self._starts[0] >= self.period:
+                self._starts.popleft()
+
+            # Window full: wait until its oldest request ages out. Holding
+            # the lock queues the other threads behind this one in order
+            if len(self._starts) >= self.max_requests:
+                time.sleep(self.period - (now - self._starts.popleft()))
+                now = time.monotonic()
+
+            self._starts.append(now)
+
+
 class FRY9CDownloader:
     """Download FR Y-9C Bank Holding Company financial data from Chicago Fed."""
 
@@ -54,42 +253,263 @@ class FRY9CDownloader:
     # Quarter month mappings
     QUARTER_MONTHS = {1: '03', 2: '06', 3: '09', 4: '12'}
 
-    def __init__(self, output_dir: str, delay_seconds: float = 0.5):
+    # Validators (ETag, Last-Modified, size) of downloaded files, by filename
+    MANIFEST_NAME = 'manifest.json'
+
+    # Files that returned 404 are not requested again for this long (they
+    # are recorded in the manifest; --refresh always rechecks)
+    MISSING_RECHECK_SECONDS = 7 * 24 * 60 * 60
+
+    # Files smaller than this are never split into --segments range requests
+    SEGMENT_MIN_SIZE = 8 * 1024 * 1024
+
+    # Give up on the remaining quarters after this many consecutive server
+    # errors (5xx/429 after retries, or connection failures): the server is
+    # down, and retrying every remaining file would only prolong the run
+    MAX_CONSECUTIVE_SERVER_ERRORS = 5
+
+    def __init__(
+        self,
+        output_dir: str,
+        delay_seconds: float = 0.5,
+        workers: int = 4,
+        refresh: bool = False,
+        cache_dir: Optional[str] = None,
+        segments: int = 1
+    ):
         """
         Initialize the FR Y-9C downloader.
 
         Args:
             output_dir: Directory to save downloaded files
-            delay_seconds: Delay between downloads to be respectful to server
+            delay_seconds: Rate limit window to be respectful to server: at
+                most `workers` downloads start within any delay_seconds
+            workers: Number of quarters to download concurrently
+            refresh: Re-check existing files against the server and
+                re-download those that have changed
+            cache_dir: Optional shared cache of downloaded files (keyed by
+                URL hash) that is linked into output_dir, so other checkouts
+                and CI runs reuse earlier downloads instead of refetching
+            segments: Byte ranges to fetch in parallel for each large file
+                (1 downloads each file over a single connection)
         """
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
         self.delay_seconds = delay_seconds
+        self.workers = max(1, workers)
+        self.segments = max(1, segments)
+        self.refresh = refresh
+        self.limiter = RateLimiter(self.workers, delay_seconds)
 
-        # Configure requests session with retry logic
-        self.session = self._create_session()
+        self.cache_dir = Path(cache_dir).expanduser() if cache_dir else None
+        if self.cache_dir:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
 
-    def _create_session(self) -> requests.Session:
-        """Create a requests session with retry logic."""
-        session = requests.Session()
+        self._server_errors = 0
+        self._server_errors_lock = threading.Lock()
 
-        retry_strategy = Retry(
-            total=5,
-            backoff_factor=2,
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["HEAD", "GET", "OPTIONS"]
-        )
+        self.manifest_path = self.output_dir / self.MANIFEST_NAME
+        self.manifest = self._load_manifest()
+        self._manifest_lock = threading.Lock()
+
+        # Reuse the process-wide session (with retry logic), sized so every
+        # worker and segment can keep its own pooled connection
+        self.session = get_shared_session(max(32, self.workers * self.segments))
+
+    def __enter__(self) -> 'FRY9CDownloader':
+        return self
 
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        session.mount("http://", adapter)
-        session.mount("https://", adapter)
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Release the downloader.
+
+        The session is shared with other downloaders in this process and
+        stays open for reuse; close_shared_sessions() (run at exit) closes it.
+        """
+
+    def _load_manifest(self) -> Dict[str, dict]:
+        """Load the download manifest, or start an empty one if missing or unreadable."""
+        try:
+            with open(self.manifest_path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
 
-        # Set user agent
-        session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+    def _record_download(self, filename: str, response: requests.Response, size: int) -> None:
+        """
+        Record a downloaded file's validators in the manifest.
+
+        The file's mtime is also set to the server's Last-Modified, so the
+        mtime fallback of --refresh works even without a manifest entry.
+
+        Args:
+            filename: Name of the downloaded file
+            response: Response the file was downloaded from
+            size: Size of the file on disk in bytes
+        """
+        entry = {
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+            'size': size
+        }
+        apply_last_modified(self.output_dir / filename, response)
+
+        self._save_manifest_entry(filename, entry)
+
+    def _record_partial(self, filename: str, response: requests.Response) -> None:
+        """
+        Record the validators of the version a .part file is being downloaded from.
+
+        Args:
+            filename: Name of the file being downloaded
+            response: Full (200) response the .part file is written from
+        """
+        self._save_manifest_entry(filename, {
+            'partial_etag': response.headers.get('ETag'),
+            'partial_last_modified': response.headers.get('Last-Modified')
         })
 
-        return session
+    def _resume_validator(self, filename: str) -> Optional[str]:
+        """
+        If-Range value pinning a resumed download to its .part file's version.
+
+        Weak ETags aren't allowed in If-Range, so they give way to
+        Last-Modified.
+
+        Args:
+            filename: Name of the file being downloaded
+
+        Returns:
+            Strong ETag or Last-Modified date, or None if neither was recorded
+        """
+        entry = self.manifest.get(filename, {})
+        etag = entry.get('partial_etag')
+        if etag and not etag.startswith('W/'):
+            return etag
+        return entry.get('partial_last_modified')
+
+    def _record_missing(self, filename: str) -> None:
+        """Record that a file was not found (404), to skip it on later runs."""
+        self._save_manifest_entry(filename, {'missing_checked': time.time()})
+
+    def _recently_missing(self, filename: str) -> Optional[float]:
+        """
+        Check whether a file returned 404 within MISSING_RECHECK_SECONDS.
+
+        Args:
+            filename: Name of the file
+
+        Returns:
+            Time of the last 404 (seconds since the epoch), or None if the
+            file should be requested
+        """
+        checked = self.manifest.get(filename, {}).get('missing_checked')
+        if checked is not None and time.time() - checked < self.MISSING_RECHECK_SECONDS:
+            return checked
+        return None
+
+    def _save_manifest_entry(self, filename: str, entry: dict) -> None:
+        """
+        Set a file's manifest entry and write the manifest to disk.
+
+        Args:
+            filename: Name of the file
+            entry: Manifest entry replacing any existing one
+        """
+        # Workers finish concurrently; write the whole manifest to a temp
+        # name and rename it so readers never see a half-written file
+        with self._manifest_lock:
+            self.manifest[filename] = entry
+            tmp_path = self.manifest_path.with_name(self.MANIFEST_NAME + '.tmp')
+            with open(tmp_path, 'w') as f:
+                json.dump(self.manifest, f, indent=2, sort_keys=True)
+            tmp_path.replace(self.manifest_path)
+
+    def _record_server_result(self, error: bool) -> None:
+        """Count consecutive server errors across workers (reset by a success)."""
+        with self._server_errors_lock:
+            self._server_errors = self._server_errors + 1 if error else 0
+
+    @property
+    def server_unavailable(self) -> bool:
+        """True once MAX_CONSECUTIVE_SERVER_ERRORS downloads in a row have failed server-side."""
+        return self._server_errors >= self.MAX_CONSECUTIVE_SERVER_ERRORS
+
+    @staticmethod
+    def _is_server_error(error: Exception) -> bool:
+        """Whether a request exception means the server (not the file) is failing."""
+        if isinstance(error, requests.exceptions.HTTPError):
+            status = error.response.status_code
+            return status == 429 or status >= 500
+        return isinstance(error, (requests.exceptions.ConnectionError, requests.exceptions.Timeout))
+
+    def _is_complete(self, job: QuarterJob) -> bool:
+        """
+        Check an existing file against the size recorded when it was downloaded.
+
+        Files with no manifest entry (e.g. copied in by hand) are trusted.
+
+        Args:
+            job: Quarter whose local file exists
+
+        Returns:
+            True unless the file's size differs from the recorded size
+        """
+        expected_size = self.manifest.get(job.filename, {}).get('size')
+        return expected_size is None or job.output_path.stat().st_size == expected_size
+
+    @staticmethod
+    def _expected_size(response: requests.Response, probe_size: Optional[int]) -> Optional[int]:
+        """
+        Full decoded size of the file a download response is delivering.
+
+        Args:
+            response: GET response (200 or 206)
+            probe_size: Size reported by the HEAD probe, if any
+
+        Returns:
+            Expected size in bytes, or None if unknown
+        """
+        # A range response states the full size after the slash
+        if response.status_code == 206:
+            total = response.headers.get('Content-Range', '').rpartition('/')[2]
+            return int(total) if total.isdigit() else None
+
+        # Content-Length of an encoded body is the compressed size, so fall
+        # back to the (identity) size from HEAD
+        length = response.headers.get('Content-Length', '')
+        if length.isdigit() and not response.headers.get('Content-Encoding'):
+            return int(length)
+        return probe_size
+
+    def _cache_path(self, job: QuarterJob) -> Path:
+        """Path of a quarter's file in the download cache."""
+        return self.cache_dir / hashlib.sha256(job.url.encode()).hexdigest()
+
+    @staticmethod
+    def _link_or_copy(src: Path, dst: Path) -> None:
+        """
+        Hardlink src to dst, copying instead across filesystems.
+
+        The link is made under a temp name and renamed over dst, so dst is
+        never seen half-written and an existing dst is replaced.
+        """
+        tmp_path = dst.with_name(dst.name + '.tmp')
+        tmp_path.unlink(missing_ok=True)
+        try:
+            os.link(src, tmp_path)
+        except OSError:
+            shutil.copy2(src, tmp_path)
+        tmp_path.replace(dst)
+
+    def _finish_download(self, part_path: Path, job: QuarterJob) -> None:
+        """Move a completed .part file into place and add it to the cache."""
+        part_path.replace(job.output_path)
+        if self.cache_dir:
+            self._link_or_copy(job.output_path, self._cache_path(job))
 
     def _format_quarter_code(self, year: int, quarter: int) -> str:
         """
@@ -102,9 +522,27 @@ class FRY9CDownloader:
         Returns:
             Filename code (e.g., '8609' for 1986 Q3, '2103' for 2021 Q1)
         """
-        year_str = str(year)[-2:]  # Last 2 digits of year
-        month_str = self.QUARTER_MONTHS[quarter]
-        return f"{year_str}{month_str}"
+        # Last 2 digits of year, then the quarter's closing month
+        return f"{year % 100:02d}{self.QUARTER_MONTHS[quarter]}"
+
+    def _probe(self, url: str) -> Tuple[int, Optional[int], dict]:
+        """
+        Check a file with a HEAD request before downloading it.
+
+        Args:
+            url: URL of the file
+
+        Returns:
+            Tuple of (status code, file size in bytes or None if not
+            reported, response headers)
+        """
+        # Ask for the unencoded size so it can be compared with bytes on disk
+        response = self.session.head(
+            url, timeout=15, allow_redirects=True,
+            headers={'Accept-Encoding': 'identity'}
+        )
+        size = response.headers.get('Content-Length', '')
+        return response.status_code, int(size) if size.isdigit() else None, response.headers
 
     def download_quarter(self, year: int, quarter: int) -> bool:
         """
@@ -117,6 +555,22 @@ class FRY9CDownloader:
         Returns:
             True if successful, False otherwise
         """
+        if not self._is_available(year, quarter):
+            return False
+
+        return self.download_job(self.quarter_job(year, quarter))
+
+    def _is_available(self, year: int, quarter: int) -> bool:
+        """
+        Check that a quarter is valid and published by Chicago Fed, logging why not.
+
+        Args:
+            year: Year (1986-2021)
+            quarter: Quarter (1-4)
+
+        Returns:
+            True if the quarter can be downloaded, False otherwise
+        """
         # Validate inputs
         if quarter not in [1, 2, 3, 4]:
             logger.error(f"Invalid quarter: {quarter}. Must be 1-4.")
@@ -132,41 +586,329 @@ class FRY9CDownloader:
             logger.warning(f"Data not available for {year} Q{quarter} (starts {self.MIN_YEAR} Q{self.MIN_QUARTER})")
             return False
 
-        # Generate filename
-        quarter_code = self._format_quarter_code(year, quarter)
-        filename = f"bhcf{quarter_code}.csv"
-        output_path = self.output_dir / filename
-        url = f"{self.CHICAGO_FED_BASE_URL}/{filename}"
+        return True
+
+    def quarter_job(self, year: int, quarter: int) -> QuarterJob:
+        """
+        Resolve the filename, URL and output path for a quarter.
+
+        Args:
+            year: Year (1986-2021)
+            quarter: Quarter (1-4)
+
+        Returns:
+            QuarterJob for the quarter
+        """
+        filename = f"bhcf{self._format_quarter_code(year, quarter)}.csv"
+        return QuarterJob(
+            year=year,
+            quarter=quarter,
+            filename=filename,
+            url=f"{self.CHICAGO_FED_BASE_URL}/{filename}",
+            output_path=self.output_dir / filename
+        )
+
+    def download_job(self, job: QuarterJob) -> bool:
+        """
+        Download a resolved quarter file from Chicago Fed.
+
+        Args:
+            job: Quarter to download (see quarter_job)
+
+        Returns:
+            True if successful, False otherwise
+        """
+        year, quarter = job.year, job.quarter
+        filename, url, output_path = job.filename, job.url, job.output_path
 
-        # Skip if file already exists
+        # Skip if file already exists, unless checking it for updates. A file
+        # whose size disagrees with the manifest is damaged and re-downloaded
         if output_path.exists():
-            logger.info(f"File already exists: {filename}")
+            if not self._is_complete(job):
+                logger.warning(f"Size mismatch, re-downloading: {filename}")
+                output_path.unlink()
+            elif not self.refresh:
+                logger.info(f"File already exists: {filename}")
+                return True
+            else:
+                return self._refresh_quarter(job)
+
+        # Cached by an earlier run (cache entries are only ever complete files)
+        if self.cache_dir and self._cache_path(job).exists():
+            self._link_or_copy(self._cache_path(job), output_path)
+            logger.info(f"Restored from cache: {filename}")
             return True
 
-        logger.info(f"Downloading: {year} Q{quarter} from Chicago Fed ({filename})")
+        # Don't re-request a file that was missing on a recent run
+        missing_checked = None if self.refresh else self._recently_missing(filename)
+        if missing_checked is not None:
+            checked_date = time.strftime('%Y-%m-%d', time.localtime(missing_checked))
+            logger.error(f"  File not found (404) on {checked_date}, not rechecked: {url}")
+            return False
 
-        try:
-            response = self.session.get(url, timeout=60, stream=True)
-            response.raise_for_status()
+        # Download into a .part file that is renamed only once complete, so an
+        # interrupted download is resumed (not mistaken for a finished file)
+        part_path = output_path.with_name(filename + '.part')
+        resume_from = part_path.stat().st_size if part_path.exists() else 0
 
-            # Download file
-            with open(output_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    if chunk:
-                        f.write(chunk)
+        # Cheap HEAD first: a missing quarter costs no body, and a partial
+        # file that is already complete is finished without another GET
+        try:
+            status, size, probe_headers = self._probe(url)
+        except requests.exceptions.RequestException as e:
+            logger.error(f"  Error checking {filename}: {e}")
+            self._record_server_result(self._is_server_error(e))
+            return False
+        if status == 404:
+            logger.error(f"  File not found (404): {url}")
+            self._record_missing(filename)
+            return False
 
-            actual_size_mb = output_path.stat().st_size / (1024 * 1024)
-            logger.info(f"  Downloaded: {filename} ({actual_size_mb:.2f} MB)")
+        # A partial file is only continued if it came from the version the
+        # server has now; otherwise old and new bytes would be spliced
+        if resume_from:
+            resume_validator = self._resume_validator(filename)
+            if resume_validator is None or resume_validator not in (
+                probe_headers.get('ETag'), probe_headers.get('Last-Modified')
+            ):
+                logger.info(f"  Partial file is from an unknown or older version of {filename}, starting over")
+                part_path.unlink()
+                resume_from = 0
+
+        if resume_from and size is not None and resume_from == size:
+            self._finish_download(part_path, job)
+            logger.info(f"  Completed: {filename} (already fully downloaded)")
             return True
 
+        # Large files from a server that accepts ranges can be fetched over
+        # several connections at once (fresh downloads only, and only where
+        # os.pwrite exists; it doesn't on Windows)
+        if (
+            self.segments > 1 and hasattr(os, 'pwrite')
+            and not resume_from and size is not None
+            and size >= self.SEGMENT_MIN_SIZE
+            and probe_headers.get('Accept-Ranges') == 'bytes'
+        ):
+            downloaded = self._download_segmented(job, size, probe_headers.get('ETag'))
+            if downloaded is not None:
+                return downloaded
+            # Ranges weren't honored after all; fetch as a single stream
+
+        headers = {}
+        if resume_from:
+            # Ranges must refer to the raw file bytes, so ask for no encoding
+            # If-Range makes the server send the whole file (200) instead if
+            # it changed after the probe
+            headers = {
+                'Range': f'bytes={resume_from}-',
+                'If-Range': resume_validator,
+                'Accept-Encoding': 'identity'
+            }
+            logger.info(f"Resuming: {year} Q{quarter} from Chicago Fed ({filename}, {resume_from:,} bytes already downloaded)")
+        else:
+            logger.info(f"Downloading: {year} Q{quarter} from Chicago Fed ({filename})")
+
+        try:
+            # Streamed responses hold their connection until closed; the with
+            # block returns it to the pool on every path out
+            with self.session.get(url, timeout=60, stream=True, headers=headers) as response:
+                # 416: nothing left past the partial file, i.e. it is already complete
+                if resume_from and response.status_code == 416:
+                    total = response.headers.get('Content-Range', '').rpartition('/')[2]
+                    if not total.isdigit() or int(total) == resume_from:
+                        self._finish_download(part_path, job)
+                        logger.info(f"  Completed: {filename} (already fully downloaded)")
+                        return True
+                    # Partial file doesn't match the server's copy; start over
+                    # (releasing this connection first)
+                    part_path.unlink()
+                    response.close()
+                    return self.download_job(job)
+
+                response.raise_for_status()
+
+                # 206 continues the partial file; anything else is the whole
+                # file, which starts the .part over (recording its version)
+                append = resume_from and response.status_code == 206 and \
+                    response.headers.get('Content-Range', '').startswith(f'bytes {resume_from}-')
+                if not append:
+                    self._record_partial(filename, response)
+
+                # Download file, copying from the raw stream in 1 MiB blocks
+                # (decoding any transfer encoding)
+                response.raw.decode_content = True
+                write_stream(response.raw, part_path, append=append)
+
+                # Don't promote a short or oversized file; a short one is kept
+                # so the next run resumes it
+                expected_size = self._expected_size(response, size)
+                part_size = part_path.stat().st_size
+                if expected_size is not None and part_size != expected_size:
+                    logger.error(f"  Incomplete download: {filename} ({part_size:,} of {expected_size:,} bytes)")
+                    if part_size > expected_size:
+                        part_path.unlink()
+                    return False
+
+                self._finish_download(part_path, job)
+
+                actual_size = output_path.stat().st_size
+                self._record_download(filename, response, actual_size)
+
+                actual_size_mb = actual_size / (1024 * 1024)
+                encoding = response.headers.get('Content-Encoding')
+                if encoding:
+                    # raw.tell() counts the (compressed) bytes read off the wire
+                    transfer_size_mb = response.raw.tell() / (1024 * 1024)
+                    logger.info(f"  Downloaded: {filename} ({actual_size_mb:.2f} MB, {transfer_size_mb:.2f} MB transferred as {encoding})")
+                else:
+                    logger.info(f"  Downloaded: {filename} ({actual_size_mb:.2f} MB)")
+                self._record_server_result(False)
+                return True
+
         except requests.exceptions.HTTPError as e:
             if e.response.status_code == 404:
                 logger.error(f"  File not found (404): {url}")
+                self._record_missing(filename)
             else:
                 logger.error(f"  HTTP error: {e}")
+            self._record_server_result(self._is_server_error(e))
             return False
         except Exception as e:
             logger.error(f"  Error downloading {filename}: {e}")
+            self._record_server_result(self._is_server_error(e))
+            return False
+
+    def _download_segmented(self, job: QuarterJob, size: int, etag: Optional[str]) -> Optional[bool]:
+        """
+        Download a file as parallel byte ranges written into one preallocated file.
+
+        Each segment is a Range GET written at its own offset with
+        os.pwrite. A strong ETag from the HEAD probe is sent as If-Range to
+        pin every segment to the same version (weak ETags aren't allowed in
+        If-Range). If any segment comes back as anything but the requested
+        range of a file of the probed size, the segments are discarded and
+        the caller downloads the file as a single stream instead.
+
+        Args:
+            job: Quarter to download
+            size: File size in bytes from the HEAD probe
+            etag: ETag from the HEAD probe, if any
+
+        Returns:
+            True if successful, False otherwise, None if the server didn't
+            honor the ranges
+        """
+        filename = job.filename
+        # Not the .part name: a preallocated file would look fully resumed
+        segments_path = job.output_path.with_name(filename + '.segments')
+        bounds = [size * i // self.segments for i in range(self.segments + 1)]
+
+        logger.info(f"Downloading: {job.year} Q{job.quarter} from Chicago Fed ({filename}, {self.segments} segments)")
+
+        def fetch(start: int, end: int) -> requests.Response:
+            headers = {'Range': f'bytes={start}-{end}', 'Accept-Encoding': 'identity'}
+            if etag and not etag.startswith('W/'):
+                headers['If-Range'] = etag
+            response = self.session.get(job.url, timeout=60, stream=True, headers=headers)
+            with response:
+                response.raise_for_status()
+                if response.status_code != 206 or \
+                        response.headers.get('Content-Range') != f'bytes {start}-{end}/{size}':
+                    raise RangeNotHonored(f"server did not return range {start}-{end}")
+
+                # pwrite may write less than asked; finish each 1 MiB block
+                # before moving on so no bytes are skipped
+                offset = start
+                for chunk in iter(lambda: response.raw.read(1024 * 1024), b''):
+                    view = memoryview(chunk)
+                    while view:
+                        written = os.pwrite(fd, view, offset)
+                        view = view[written:]
+                        offset += written
+                if offset != end + 1:
+                    raise ValueError(f"range {start}-{end} ended at byte {offset:,}")
+            return response
+
+        fd = os.open(segments_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.ftruncate(fd, size)
+            with ThreadPoolExecutor(max_workers=self.segments) as executor:
+                responses = list(executor.map(
+                    fetch, bounds[:-1], [end - 1 for end in bounds[1:]]
+                ))
+            if hasattr(os, 'fdatasync'):
+                os.fdatasync(fd)
+            else:
+                os.fsync(fd)
+        except RangeNotHonored as e:
+            os.close(fd)
+            segments_path.unlink(missing_ok=True)
+            logger.warning(f"  {e}; downloading {filename} as a single stream")
+            return None
+        except Exception as e:
+            os.close(fd)
+            segments_path.unlink(missing_ok=True)
+            logger.error(f"  Error downloading {filename}: {e}")
+            self._record_server_result(self._is_server_error(e))
+            return False
+        os.close(fd)
+
+        self._finish_download(segments_path, job)
+        self._record_download(filename, responses[0], size)
+        self._record_server_result(False)
+        logger.info(f"  Downloaded: {filename} ({size / (1024 * 1024):.2f} MB)")
+        return True
+
+    def _refresh_quarter(self, job: QuarterJob) -> bool:
+        """
+        Re-download an existing quarter file only if the server's copy changed.
+
+        Sends a conditional GET using the ETag/Last-Modified recorded in the
+        manifest (falling back to the file's mtime), so an unchanged file
+        costs a single empty 304 response.
+
+        Args:
+            job: Quarter whose local file already exists
+
+        Returns:
+            True if the local file is current (or was updated), False otherwise
+        """
+        filename, url, output_path = job.filename, job.url, job.output_path
+        entry = self.manifest.get(filename, {})
+
+        headers = {}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        headers['If-Modified-Since'] = entry.get('last_modified') or \
+            formatdate(output_path.stat().st_mtime, usegmt=True)
+
+        logger.info(f"Checking: {job.year} Q{job.quarter} for updates ({filename})")
+
+        try:
+            with self.session.get(url, timeout=60, stream=True, headers=headers) as response:
+                if response.status_code == 304:
+                    logger.info(f"  Not modified: {filename}")
+                    return True
+
+                response.raise_for_status()
+
+                # Changed on the server: replace the file via a temp name so a
+                # failed transfer keeps the previous copy
+                part_path = output_path.with_name(filename + '.part')
+                response.raw.decode_content = True
+                write_stream(response.raw, part_path)
+                self._finish_download(part_path, job)
+
+                actual_size = output_path.stat().st_size
+                self._record_download(filename, response, actual_size)
+                logger.info(f"  Updated: {filename} ({actual_size / (1024 * 1024):.2f} MB)")
+                return True
+
+        except requests.exceptions.HTTPError as e:
+            logger.error(f"  HTTP error: {e}")
+            return False
+        except Exception as e:
+            logger.error(f"  Error refreshing {filename}: {e}")
             return False
 
     def generate_quarter_list(
@@ -251,19 +993,46 @@ class FRY9CDownloader:
             'skipped': []
         }
 
-        for i, (year, quarter) in enumerate(quarters, 1):
-            logger.info(f"[{i}/{len(quarters)}] Processing {year} Q{quarter}")
-
-            success = self.download_quarter(year, quarter)
-
-            if success:
-                results['successful'].append((year, quarter))
+        # Resolve filenames and URLs once, before any downloads start
+        jobs = []
+        for year, quarter in quarters:
+            if self._is_available(year, quarter):
+                jobs.append(self.quarter_job(year, quarter))
             else:
                 results['failed'].append((year, quarter))
 
-            # Respectful delay between downloads
-            if i < len(quarters):
-                time.sleep(self.delay_seconds)
+        def download(i: int, job: QuarterJob) -> bool:
+            # Fail the rest of the run fast once the server is clearly down
+            if self.server_unavailable:
+                logger.error(f"[{i}/{len(jobs)}] Skipping {job.year} Q{job.quarter}: server unavailable")
+                return False
+
+            # Wait only if too many downloads started recently
+            self.limiter.acquire()
+            logger.info(f"[{i}/{len(jobs)}] Processing {job.year} Q{job.quarter}")
+            return self.download_job(job)
+
+        # Downloads are network-bound, so a few run concurrently on threads
+        # sharing the session's connection pool
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            futures = {
+                executor.submit(download, i, job): (job.year, job.quarter)
+                for i, job in enumerate(jobs, 1)
+            }
+
+            # Quarters finish out of order, so report progress as they complete
+            for completed, future in enumerate(as_completed(futures), 1):
+                if future.result():
+                    results['successful'].append(futures[future])
+                else:
+                    results['failed'].append(futures[future])
+
+                if completed % 10 == 0 or completed == len(futures):
+                    logger.info(f"Completed {completed}/{len(futures)} quarters "
+                                f"({len(results['successful'])} successful)")
+
+        results['successful'].sort()
+        results['failed'].sort()
 
         return results
 
@@ -284,6 +1053,19 @@ Examples:
   # Custom output directory
     python 01_download_data.py --output-dir data/raw
 
+  # Download one quarter at a time
+    python 01_download_data.py --workers 1
+
+  # Re-check downloaded quarters (and recently missing ones) and fetch
+  # only those that changed
+    python 01_download_data.py --refresh
+
+  # Share downloads between checkouts through a cache directory
+    python 01_download_data.py --cache-dir ~/.cache/fry9c
+
+  # Fetch each large file as 4 parallel byte ranges
+    python 01_download_data.py --segments 4
+
   # Enable debug logging
     python 01_download_data.py --verbose
 
@@ -335,7 +1117,34 @@ Note:
         '--delay',
         type=float,
         default=0.5,
-        help='Delay between downloads in seconds (default: 0.5)'
+        help='Rate limit window in seconds: at most --workers downloads start per window (default: 0.5)'
+    )
+
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=4,
+        help='Number of concurrent downloads (default: 4)'
+    )
+
+    parser.add_argument(
+        '--refresh',
+        action='store_true',
+        help='Check existing files for updates and re-download any that changed; '
+             'also retry files that were missing (404) on a recent run'
+    )
+
+    parser.add_argument(
+        '--cache-dir',
+        type=str,
+        help='Shared download cache linked into --output-dir (e.g. ~/.cache/fry9c; default: no cache)'
+    )
+
+    parser.add_argument(
+        '--segments',
+        type=int,
+        default=1,
+        help='Parallel byte-range requests per file of 8 MB or more (default: 1)'
     )
 
     parser.add_argument(
@@ -357,17 +1166,20 @@ Note:
     logger.info(f"Output directory: {Path(args.output_dir).absolute()}")
     logger.info("Source: Chicago Fed (1986 Q3 - 2021 Q1)")
 
-    downloader = FRY9CDownloader(
+    with FRY9CDownloader(
         output_dir=args.output_dir,
-        delay_seconds=args.delay
-    )
-
-    results = downloader.download_range(
-        start_year=args.start_year,
-        start_quarter=args.start_quarter,
-        end_year=args.end_year,
-        end_quarter=args.end_quarter
-    )
+        delay_seconds=args.delay,
+        workers=args.workers,
+        refresh=args.refresh,
+        cache_dir=args.cache_dir,
+        segments=args.segments
+    ) as downloader:
+        results = downloader.download_range(
+            start_year=args.start_year,
+            start_quarter=args.start_quarter,
+            end_year=args.end_year,
+            end_quarter=args.end_quarter
+        )
 
     # Print summary
     logger.info("=" * 60)
@@ -9,12 +9,19 @@ Source: https://www.federalreserve.gov/apps/mdrm/download_mdrm.htm
 Usage:
     python 02_download_dictionary.py
     python 02_download_dictionary.py --output-dir data/raw
+    python 02_download_dictionary.py --refresh  # Re-download only if changed
 """
 
 import argparse
+import os
+import shutil
 import sys
+import tempfile
+import time
 import zipfile
+from email.utils import formatdate, parsedate_to_datetime
 from pathlib import Path
+from typing import Optional
 
 import requests
 from requests.adapters import HTTPAdapter
@@ -23,6 +30,9 @@ from urllib3.util.retry import Retry
 
 MDRM_URL = "https://www.federalreserve.gov/apps/mdrm/pdf/MDRM.zip"
 
+# Downloaded ZIP is held in memory up to this size, then spilled to a temp file
+ZIP_SPOOL_MAX_SIZE = 64 * 1024 * 1024
+
 
 def create_session() -> requests.Session:
     """Create a requests session with retry logic."""
@@ -45,68 +55,108 @@ def create_session() -> requests.Session:
     return session
 
 
-def download_mdrm(output_dir: Path) -> bool:
+def download_mdrm(
+    output_dir: Path,
+    session: Optional[requests.Session] = None,
+    refresh: bool = False
+) -> bool:
     """
     Download and extract the MDRM data dictionary.
 
     Args:
         output_dir: Directory to save the dictionary files
+        session: Session to download with (default: a new retrying session).
+            Pass a shared session when fetching alongside other resources
+            so they reuse one connection pool.
+        refresh: Re-check an existing MDRM.csv against the server and only
+            re-download it if the published dictionary has changed
 
     Returns:
         True if successful, False otherwise
     """
-    output_dir.mkdir(parents=True, exist_ok=True)
-
-    zip_path = output_dir / "mdrm.zip"
     csv_path = output_dir / "MDRM.csv"
+    etag_path = output_dir / "MDRM.etag"
 
-    # Check if already downloaded
-    if csv_path.exists():
+    # Check if already downloaded before touching the filesystem or network
+    if csv_path.exists() and not refresh:
         print(f"MDRM dictionary already exists: {csv_path}")
         return True
 
-    print(f"Downloading MDRM dictionary from Federal Reserve...")
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    # Conditional request so an unchanged dictionary costs one empty 304
+    headers = {}
+    if csv_path.exists():
+        if etag_path.exists():
+            headers['If-None-Match'] = etag_path.read_text().strip()
+        headers['If-Modified-Since'] = formatdate(csv_path.stat().st_mtime, usegmt=True)
+        print("Checking MDRM dictionary for updates...")
+    else:
+        print(f"Downloading MDRM dictionary from Federal Reserve...")
     print(f"  URL: {MDRM_URL}")
 
     try:
-        session = create_session()
-        response = session.get(MDRM_URL, timeout=60, stream=True)
+        if session is None:
+            session = create_session()
+        response = session.get(MDRM_URL, timeout=60, stream=True, headers=headers)
+
+        if response.status_code == 304:
+            print(f"  Not modified, keeping: {csv_path}")
+            return True
+
         response.raise_for_status()
 
-        # Save ZIP file
-        with open(zip_path, 'wb') as f:
-            for chunk in response.iter_content(chunk_size=8192):
-                if chunk:
-                    f.write(chunk)
-
-        zip_size_mb = zip_path.stat().st_size / (1024 * 1024)
-        print(f"  Downloaded: mdrm.zip ({zip_size_mb:.2f} MB)")
-
-        # Extract CSV from ZIP
-        print("  Extracting...")
-        with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-            # Find the CSV file (case-insensitive)
-            csv_file = None
-            for name in zip_ref.namelist():
-                if name.upper().endswith('.CSV'):
-                    csv_file = name
-                    break
-
-            if not csv_file:
-                print("  ERROR: No CSV file found in ZIP")
-                return False
-
-            # Extract CSV
-            with zip_ref.open(csv_file) as source:
-                with open(csv_path, 'wb') as target:
-                    target.write(source.read())
+        # Buffer the ZIP in memory (spilling to a temp file if unexpectedly
+        # large) and extract straight from it, rather than round-tripping
+        # through mdrm.zip on disk. Copy from the raw stream in 1 MiB blocks
+        # (decoding any transfer encoding) instead of looping over 8 KB chunks
+        with tempfile.SpooledTemporaryFile(max_size=ZIP_SPOOL_MAX_SIZE) as zip_buffer:
+            response.raw.decode_content = True
+            shutil.copyfileobj(response.raw, zip_buffer, length=1024 * 1024)
+
+            zip_size_mb = zip_buffer.tell() / (1024 * 1024)
+            print(f"  Downloaded: MDRM.zip ({zip_size_mb:.2f} MB)")
+
+            # Extract CSV from ZIP
+            print("  Extracting...")
+            zip_buffer.seek(0)
+            with zipfile.ZipFile(zip_buffer, 'r') as zip_ref:
+                # Find the CSV file (case-insensitive)
+                csv_file = None
+                for name in zip_ref.namelist():
+                    if name.upper().endswith('.CSV'):
+                        csv_file = name
+                        break
+
+                if not csv_file:
+                    print("  ERROR: No CSV file found in ZIP")
+                    return False
+
+                # Extract CSV in 1 MiB chunks rather than reading it into
+                # memory; write to a temp name so a failed refresh keeps the
+                # previous MDRM.csv intact
+                part_path = csv_path.with_name(csv_path.name + '.part')
+                with zip_ref.open(csv_file) as source, open(part_path, 'wb') as target:
+                    shutil.copyfileobj(source, target, length=1024 * 1024)
+                part_path.replace(csv_path)
 
         csv_size_mb = csv_path.stat().st_size / (1024 * 1024)
         print(f"  Extracted: MDRM.csv ({csv_size_mb:.2f} MB)")
 
-        # Clean up ZIP
-        zip_path.unlink()
-        print("  Cleaned up ZIP file")
+        # Remember the version downloaded for later --refresh runs: the ETag,
+        # and the server's Last-Modified as the CSV's mtime (used for
+        # If-Modified-Since when there is no ETag)
+        try:
+            modified = parsedate_to_datetime(response.headers['Last-Modified']).timestamp()
+            os.utime(csv_path, (time.time(), modified))
+        except (KeyError, TypeError, ValueError):
+            pass
+
+        etag = response.headers.get('ETag')
+        if etag:
+            etag_path.write_text(etag)
+        elif etag_path.exists():
+            etag_path.unlink()
 
         return True
 
@@ -115,8 +165,6 @@ def download_mdrm(output_dir: Path) -> bool:
         return False
     except zipfile.BadZipFile:
         print("  ERROR: Downloaded file is not a valid ZIP")
-        if zip_path.exists():
-            zip_path.unlink()
         return False
     except Exception as e:
         print(f"  ERROR: {e}")
@@ -131,6 +179,7 @@ def main():
 Examples:
   python 02_download_dictionary.py
   python 02_download_dictionary.py --output-dir data/raw
+  python 02_download_dictionary.py --refresh  # Re-download only if changed
 
 The MDRM (Micro Data Reference Manual) contains variable definitions
 and descriptions for all Federal Reserve reporting forms including FR Y-9.
@@ -144,6 +193,12 @@ and descriptions for all Federal Reserve reporting forms including FR Y-9.
         help='Directory to save dictionary files (default: data/raw)'
     )
 
+    parser.add_argument(
+        '--refresh',
+        action='store_true',
+        help='Check an existing MDRM.csv for updates and re-download if it changed'
+    )
+
     args = parser.parse_args()
 
     print("=" * 60)
@@ -152,7 +207,7 @@ and descriptions for all Federal Reserve reporting forms including FR Y-9.
 
     output_dir = Path(args.output_dir)
 
-    success = download_mdrm(output_dir)
+    success = download_mdrm(output_dir, refresh=args.refresh)
 
     if success:
         print("\n" + "=" * 60)
@@ -10,6 +10,7 @@ Usage:
     python 03_parse_dictionary.py
     python 03_parse_dictionary.py --input-dir data/raw --output-dir data/processed
     python 03_parse_dictionary.py --force  # Re-process even if outputs exist
+    python 03_parse_dictionary.py --also-csv  # Also write data_dictionary.csv.gz
 """
 
 import argparse
@@ -19,11 +20,38 @@ import html
 from pathlib import Path
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pv
 
 
 # FR Y-9 related mnemonics
 FR_Y9_MNEMONICS = ['BHCK', 'BHCP', 'BHSP']
 
+# Reporting form for each mnemonic
+FILER_TYPE_NAMES = {
+    'BHCK': 'FR Y-9C',
+    'BHCP': 'FR Y-9LP',
+    'BHSP': 'FR Y-9SP'
+}
+
+# MDRM columns needed to build the dictionary (the rest are never read)
+MDRM_COLUMNS = [
+    'Mnemonic',
+    'Item Code',
+    'Item Name',
+    'Description',
+    'Start Date',
+    'End Date',
+    'Reporting Form'
+]
+
+# Low-cardinality MDRM columns, loaded dictionary-encoded (categoricals)
+MDRM_DICTIONARY_COLUMNS = ['Mnemonic', 'Start Date', 'End Date', 'Reporting Form']
+
+# Runs of whitespace, including HTML-encoded carriage returns, in descriptions
+_WHITESPACE_RE = re.compile(r'(?:&#x0D;|\s)+')
+
 
 def clean_description(text: str) -> str:
     """
@@ -42,28 +70,36 @@ def clean_description(text: str) -> str:
     if pd.isna(text):
         return ""
 
-    # Decode HTML entities (&#x0D; etc.)
-    text = html.unescape(str(text))
+    # Decode HTML entities (&#x0D; etc.), then collapse line breaks and
+    # whitespace runs to single spaces in one pass
+    return _WHITESPACE_RE.sub(' ', html.unescape(str(text))).strip()
+
+
+def clean_series(series: pd.Series) -> pd.Series:
+    """
+    Clean a whole description column.
 
-    # Replace common HTML-encoded characters
-    text = text.replace('&#x0D;', ' ')
-    text = text.replace('\r\n', ' ')
-    text = text.replace('\r', ' ')
-    text = text.replace('\n', ' ')
+    Descriptions repeat heavily across MDRM entries, so each distinct
+    string is cleaned once and the results are mapped back onto the column.
 
-    # Normalize whitespace
-    text = re.sub(r'\s+', ' ', text).strip()
+    Args:
+        series: Raw description column
 
-    return text
+    Returns:
+        Cleaned descriptions (missing values become empty strings)
+    """
+    cleaned = {text: clean_description(text) for text in series.dropna().unique()}
+    return series.map(cleaned).fillna('')
 
 
-def parse_mdrm(input_path: Path, output_dir: Path) -> bool:
+def parse_mdrm(input_path: Path, output_dir: Path, also_csv: bool = False) -> bool:
     """
     Parse MDRM CSV and create filtered dictionary for FR Y-9 variables.
 
     Args:
         input_path: Path to MDRM.csv
         output_dir: Directory to save processed dictionary
+        also_csv: Also write a gzipped CSV copy for human inspection
 
     Returns:
         True if successful, False otherwise
@@ -75,20 +111,50 @@ def parse_mdrm(input_path: Path, output_dir: Path) -> bool:
 
     print(f"Reading MDRM dictionary: {input_path}")
 
-    # Read CSV (skip first row which just says "PUBLIC")
-    df = pd.read_csv(
+    # Stream the CSV in blocks with Arrow's reader (skip first row which just
+    # says "PUBLIC"), keeping only FR Y-9 rows so the full MDRM is never held
+    # in memory at once
+    reader = pv.open_csv(
         input_path,
-        skiprows=1,
-        encoding='latin-1',
-        low_memory=False,
-        dtype=str
+        read_options=pv.ReadOptions(skip_rows=1, encoding='latin-1'),
+        parse_options=pv.ParseOptions(newlines_in_values=True),
+        convert_options=pv.ConvertOptions(
+            include_columns=MDRM_COLUMNS,
+            column_types={
+                col: pa.dictionary(pa.int32(), pa.string()) if col in MDRM_DICTIONARY_COLUMNS else pa.string()
+                for col in MDRM_COLUMNS
+            },
+            strings_can_be_null=True
+        )
     )
 
-    print(f"  Total entries: {len(df):,}")
-    print(f"  Unique mnemonics: {df['Mnemonic'].nunique()}")
+    mnemonics = pa.array(FR_Y9_MNEMONICS)
+    total_entries = 0
+    all_mnemonics = set()
+    batches = []
+
+    for batch in reader:
+        total_entries += batch.num_rows
+        all_mnemonics.update(batch.column('Mnemonic').unique().to_pylist())
+        batches.append(batch.filter(pc.is_in(batch.column('Mnemonic'), value_set=mnemonics)))
+
+    all_mnemonics.discard(None)
+
+    table = pa.Table.from_batches(batches, schema=reader.schema)
+
+    # Create variable name (Mnemonic + Item Code) with Arrow string kernels
+    table = table.append_column('Variable', pc.binary_join_element_wise(
+        table.column('Mnemonic').cast(pa.string()),
+        pc.utf8_trim_whitespace(table.column('Item Code')),
+        ''
+    ))
+
+    # Dictionary columns convert to pandas categoricals
+    df_filtered = table.to_pandas()
+
+    print(f"  Total entries: {total_entries:,}")
+    print(f"  Unique mnemonics: {len(all_mnemonics)}")
 
-    # Filter to FR Y-9 related mnemonics
-    df_filtered = df[df['Mnemonic'].isin(FR_Y9_MNEMONICS)].copy()
     print(f"\nFiltering to FR Y-9 mnemonics ({', '.join(FR_Y9_MNEMONICS)})...")
     print(f"  Entries after filter: {len(df_filtered):,}")
 
@@ -97,78 +163,86 @@ def parse_mdrm(input_path: Path, output_dir: Path) -> bool:
         print("Expected mnemonics: " + ", ".join(FR_Y9_MNEMONICS))
         return False
 
-    # Create variable name (Mnemonic + Item Code)
-    df_filtered['Variable'] = df_filtered['Mnemonic'] + df_filtered['Item Code'].str.strip()
-
-    # Parse dates for sorting
-    df_filtered['EndDateParsed'] = pd.to_datetime(
-        df_filtered['End Date'],
+    # Parse dates for selecting the latest definition (missing dates rank last).
+    # End dates take only a handful of distinct values, so each category is
+    # parsed once and broadcast back through the category codes
+    end_dates = df_filtered['End Date'].cat
+    parsed_end_dates = pd.to_datetime(
+        end_dates.categories,
         format='%m/%d/%Y %I:%M:%S %p',
         errors='coerce'
     )
+    df_filtered['EndDateParsed'] = pd.Series(
+        parsed_end_dates.take(end_dates.codes, allow_fill=True, fill_value=pd.NaT),
+        index=df_filtered.index
+    ).fillna(pd.Timestamp('1900-01-01'))
 
     # Keep only the most recent entry for each variable (latest End Date)
     # This handles cases where a variable has multiple historical definitions
-    df_filtered = df_filtered.sort_values('EndDateParsed', ascending=False)
-    df_deduped = df_filtered.drop_duplicates(subset=['Variable'], keep='first').copy()
+    latest_idx = df_filtered.groupby('Variable', sort=False)['EndDateParsed'].idxmax()
+
+    # Create output dataframe with relevant columns, sorted by variable name.
+    # Selecting, renaming and sorting in one chain avoids intermediate copies
+    output_df = (
+        df_filtered.loc[latest_idx, [
+            'Variable',
+            'Mnemonic',
+            'Item Code',
+            'Item Name',
+            'Description',
+            'Start Date',
+            'End Date',
+            'Reporting Form'
+        ]]
+        .rename(columns={
+            'Item Code': 'ItemCode',
+            'Item Name': 'ItemName',
+            'Start Date': 'StartDate',
+            'End Date': 'EndDate',
+            'Reporting Form': 'ReportingForm'
+        })
+        .sort_values('Variable', ignore_index=True)
+    )
 
-    print(f"  Unique variables: {len(df_deduped):,}")
+    print(f"  Unique variables: {len(output_df):,}")
 
     # Clean descriptions
     print("\nCleaning descriptions...")
-    df_deduped['Description'] = df_deduped['Description'].apply(clean_description)
-    df_deduped['ItemName'] = df_deduped['Item Name'].apply(clean_description)
-
-    # Create output dataframe with relevant columns
-    output_df = df_deduped[[
-        'Variable',
-        'Mnemonic',
-        'Item Code',
-        'ItemName',
-        'Description',
-        'Start Date',
-        'End Date',
-        'Reporting Form'
-    ]].copy()
-
-    output_df = output_df.rename(columns={
-        'Item Code': 'ItemCode',
-        'Start Date': 'StartDate',
-        'End Date': 'EndDate',
-        'Reporting Form': 'ReportingForm'
-    })
-
-    # Sort by variable name
-    output_df = output_df.sort_values('Variable').reset_index(drop=True)
+    output_df['Description'] = clean_series(output_df['Description'])
+    output_df['ItemName'] = clean_series(output_df['ItemName'])
 
     # Create output directory
     output_dir.mkdir(parents=True, exist_ok=True)
 
     # Save as parquet (efficient for metadata lookups)
     parquet_path = output_dir / 'data_dictionary.parquet'
-    output_df.to_parquet(parquet_path, index=False)
+    output_df.to_parquet(
+        parquet_path,
+        index=False,
+        engine='pyarrow',
+        compression='zstd',
+        compression_level=3,
+        use_dictionary=['Mnemonic', 'StartDate', 'EndDate', 'ReportingForm']
+    )
     parquet_size = parquet_path.stat().st_size / 1024
     print(f"\nSaved: {parquet_path} ({parquet_size:.1f} KB)")
 
-    # Also save as CSV for human readability
-    csv_path = output_dir / 'data_dictionary.csv'
-    output_df.to_csv(csv_path, index=False)
-    csv_size = csv_path.stat().st_size / 1024
-    print(f"Saved: {csv_path} ({csv_size:.1f} KB)")
+    # Optionally save a gzipped CSV for human readability
+    if also_csv:
+        csv_path = output_dir / 'data_dictionary.csv.gz'
+        output_df.to_csv(csv_path, index=False, compression='gzip')
+        csv_size = csv_path.stat().st_size / 1024
+        print(f"Saved: {csv_path} ({csv_size:.1f} KB)")
 
     # Print summary by mnemonic
     print("\n" + "=" * 60)
     print("DICTIONARY SUMMARY")
     print("=" * 60)
 
+    counts = output_df['Mnemonic'].value_counts()
     for mnemonic in FR_Y9_MNEMONICS:
-        count = len(output_df[output_df['Mnemonic'] == mnemonic])
-        filer_type = {
-            'BHCK': 'FR Y-9C',
-            'BHCP': 'FR Y-9LP',
-            'BHSP': 'FR Y-9SP'
-        }.get(mnemonic, mnemonic)
-        print(f"  {mnemonic} ({filer_type}): {count:,} variables")
+        filer_type = FILER_TYPE_NAMES.get(mnemonic, mnemonic)
+        print(f"  {mnemonic} ({filer_type}): {counts.get(mnemonic, 0):,} variables")
 
     print(f"\n  Total: {len(output_df):,} variables")
 
@@ -196,6 +270,7 @@ Examples:
   python 03_parse_dictionary.py
   python 03_parse_dictionary.py --input-dir data/raw --output-dir data/processed
   python 03_parse_dictionary.py --force  # Re-process even if outputs exist
+  python 03_parse_dictionary.py --also-csv  # Also write a gzipped CSV copy
 
 The script filters the MDRM to include only FR Y-9 related variables:
   - BHCK: FR Y-9C variables
@@ -204,7 +279,7 @@ The script filters the MDRM to include only FR Y-9 related variables:
 
 Output files:
   - data_dictionary.parquet: Efficient format for metadata lookups
-  - data_dictionary.csv: Human-readable format
+  - data_dictionary.csv.gz: Human-readable format (with --also-csv)
         """
     )
 
@@ -228,6 +303,12 @@ Output files:
         help='Re-process even if output files already exist'
     )
 
+    parser.add_argument(
+        '--also-csv',
+        action='store_true',
+        help='Also write a gzipped CSV copy of the dictionary (data_dictionary.csv.gz)'
+    )
+
     args = parser.parse_args()
 
     print("=" * 60)
@@ -240,17 +321,18 @@ Output files:
 
     # Check if output already exists (unless --force)
     parquet_path = output_dir / 'data_dictionary.parquet'
-    csv_path = output_dir / 'data_dictionary.csv'
+    csv_path = output_dir / 'data_dictionary.csv.gz'
 
-    if not args.force and parquet_path.exists() and csv_path.exists():
+    if not args.force and parquet_path.exists() and (csv_path.exists() or not args.also_csv):
         print(f"\nOutput files already exist:")
         print(f"  {parquet_path}")
-        print(f"  {csv_path}")
+        if args.also_csv:
+            print(f"  {csv_path}")
         print("\nUse --force to re-process.")
         print("=" * 60)
         return 0
 
-    success = parse_mdrm(input_path, output_dir)
+    success = parse_mdrm(input_path, output_dir, also_csv=args.also_csv)
 
     if success:
         print("=" * 60)
@@ -30,24 +30,66 @@ Usage:
     python 04_parse_data.py --force
 """
 
+import numpy as np
 import pandas as pd
 import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pv
 import pyarrow.parquet as pq
 import argparse
+import csv
+import io
+import os
+import shutil
+import struct
 import sys
+import traceback
 import zipfile
+import zlib
 from pathlib import Path
-from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Mapping
 import multiprocessing
 import re
 
 
-# Global cache for data dictionary
-_DATA_DICTIONARY = None
-_DICTIONARY_PATH = None
+# Output subdirectory and variable prefix for each filer type
+# BHCK = FR Y-9C (quarterly filers)
+# BHCP = FR Y-9LP (quarterly, large/complex)
+# BHSP = FR Y-9SP (semi-annual, smaller institutions)
+FILER_TYPES = {
+    'y_9c': 'BHCK',
+    'y_9lp': 'BHCP',
+    'y_9sp': 'BHSP'
+}
 
+# Raw file names: quarterly ZIPs (BHCF20210630.zip) and CSVs (bhcf2106.csv)
+BHCF_ZIP_PATTERN = re.compile(r'^bhcf(\d{4})(\d{2})(\d{2})\.zip$', re.IGNORECASE)
+BHCF_CSV_PATTERN = re.compile(r'^bhcf\d{4}\.csv$', re.IGNORECASE)
 
-def load_data_dictionary(dict_path: Path) -> dict:
+# Data file inside an FFIEC ZIP (BHCF20210630.txt)
+BHCF_TXT_PATTERN = re.compile(r'^bhcf.*\.txt$', re.IGNORECASE)
+
+# Year and quarter-end month in a CSV filename (bhcfYYQQ)
+QUARTER_PATTERN = re.compile(r'bhcf(\d{2})(\d{2})', re.IGNORECASE)
+
+# Settings shared by every file in a run, set per process by init_worker
+_WORKER_SETTINGS = {}
+
+# Arrow CSV reader block size (files are streamed one block at a time)
+CSV_BLOCK_SIZE = 16 * 1024 * 1024
+
+@lru_cache(maxsize=4)
+def _load_data_dictionary_cached(path_str: str) -> MappingProxyType:
+    """Read a data dictionary once per process (keyed on resolved path)."""
+    df = pd.read_parquet(path_str, columns=['Variable', 'ItemName'])
+    # Create mapping: Variable -> ItemName (short description)
+    return MappingProxyType(dict(zip(df['Variable'], df['ItemName'])))
+
+
+def load_data_dictionary(dict_path: Path) -> Mapping[str, str]:
     """
     Load the data dictionary for variable descriptions.
 
@@ -55,44 +97,59 @@ def load_data_dictionary(dict_path: Path) -> dict:
         dict_path: Path to data_dictionary.parquet
 
     Returns:
-        Dictionary mapping variable names to descriptions
+        Read-only mapping of variable names to descriptions (cached)
     """
-    global _DATA_DICTIONARY, _DICTIONARY_PATH
-
-    # Return cached if already loaded
-    if _DATA_DICTIONARY is not None and _DICTIONARY_PATH == dict_path:
-        return _DATA_DICTIONARY
-
     if not dict_path.exists():
         return {}
 
     try:
-        df = pd.read_parquet(dict_path)
-        # Create mapping: Variable -> ItemName (short description)
-        _DATA_DICTIONARY = dict(zip(df['Variable'], df['ItemName']))
-        _DICTIONARY_PATH = dict_path
-        return _DATA_DICTIONARY
+        return _load_data_dictionary_cached(str(dict_path.resolve()))
     except Exception:
         return {}
 
 
-def write_parquet_with_metadata(df: pd.DataFrame, output_path: Path, dict_path: Path = None):
+def init_worker(output_dir_str, dict_path_str, compression):
+    """
+    Initialize a worker process with the settings shared by every file.
+
+    The settings are stored once per process so each task only carries its
+    own file, and the data dictionary is loaded up front so every file the
+    worker handles reuses the cached copy.
+
+    Args:
+        output_dir_str: Directory to save parquet files
+        dict_path_str: Path to data_dictionary.parquet, or None
+        compression: Parquet compression codec
+    """
+    _WORKER_SETTINGS.update(
+        output_dir=Path(output_dir_str),
+        dict_path=Path(dict_path_str) if dict_path_str else None,
+        compression=compression
+    )
+    if dict_path_str:
+        load_data_dictionary(Path(dict_path_str))
+
+
+def write_parquet_with_metadata(
+    table: pa.Table,
+    output_path: Path,
+    dict_path: Path = None,
+    compression: str = 'zstd'
+):
     """
-    Write DataFrame to parquet with column descriptions as metadata.
+    Write an Arrow table to parquet with column descriptions as metadata.
 
     Args:
-        df: DataFrame to write
+        table: Table to write
         output_path: Path for output parquet file
         dict_path: Path to data dictionary (optional)
+        compression: Parquet compression codec (default: zstd)
     """
     # Load dictionary if available
     var_descriptions = {}
     if dict_path:
         var_descriptions = load_data_dictionary(dict_path)
 
-    # Convert to pyarrow Table
-    table = pa.Table.from_pandas(df, preserve_index=False)
-
     # Add column metadata if dictionary available
     if var_descriptions:
         # Build new schema with field metadata
@@ -111,8 +168,96 @@ def write_parquet_with_metadata(df: pd.DataFrame, output_path: Path, dict_path:
         new_schema = pa.schema(new_fields)
         table = table.cast(new_schema)
 
-    # Write parquet
-    pq.write_table(table, output_path, compression='snappy')
+    # Write parquet. Columns are sparse and low-cardinality, so dictionary
+    # encoding plus zstd keeps files small; a quarter fits in one row group
+    pq.write_table(
+        table,
+        output_path,
+        compression=compression,
+        compression_level=3 if compression == 'zstd' else None,
+        use_dictionary=True,
+        row_group_size=500_000,
+        data_page_size=1024 * 1024,
+        write_statistics=True
+    )
+
+
+def list_matching_files(directory: Path, pattern: re.Pattern) -> list:
+    """
+    List files in a directory whose names match a compiled pattern.
+
+    A single scandir pass with a case-insensitive pattern replaces separate
+    BHCF*/bhcf* globs, which listed the directory twice and returned
+    duplicates on case-insensitive filesystems.
+
+    Args:
+        directory: Directory to scan
+        pattern: Compiled filename pattern
+
+    Returns:
+        List of matching file paths
+    """
+    with os.scandir(directory) as entries:
+        return [Path(entry.path) for entry in entries if entry.is_file() and pattern.match(entry.name)]
+
+
+def copy_zip_member(zip_ref: zipfile.ZipFile, member: str, target) -> None:
+    """
+    Copy a ZIP member into an open binary file.
+
+    Stored (uncompressed) members are copied file-to-file by the kernel with
+    os.sendfile on Linux, then checked against the member's size and CRC-32
+    as zipfile would on read (raising zipfile.BadZipFile). Everything else is decompressed through
+    zipfile in 1 MiB chunks rather than reading the whole member into memory.
+
+    Args:
+        zip_ref: Open ZipFile (backed by a file on disk)
+        member: Name of the member to copy
+        target: Binary file object opened for writing
+    """
+    info = zip_ref.getinfo(member)
+    encrypted = info.flag_bits & 0x1
+
+    if (info.compress_type == zipfile.ZIP_STORED and not encrypted
+            and sys.platform.startswith('linux') and zip_ref.filename):
+        with open(zip_ref.filename, 'rb') as source:
+            # Member data follows its local file header: 30 fixed bytes, then
+            # the file name and extra field (lengths stored in the header)
+            source.seek(info.header_offset)
+            header = source.read(30)
+            if header[:4] == b'PK\x03\x04':
+                name_length, extra_length = struct.unpack('<HH', header[26:30])
+                data_offset = info.header_offset + 30 + name_length + extra_length
+                target.flush()
+                start = os.lseek(target.fileno(), 0, os.SEEK_CUR)
+                offset = data_offset
+                remaining = info.file_size
+                while remaining > 0:
+                    sent = os.sendfile(target.fileno(), source.fileno(), offset, remaining)
+                    if sent == 0:
+                        raise zipfile.BadZipFile(f"Truncated member {member}")
+                    offset += sent
+                    remaining -= sent
+                if os.lseek(target.fileno(), 0, os.SEEK_CUR) - start != info.file_size:
+                    raise zipfile.BadZipFile(f"Truncated member {member}")
+
+                # sendfile skips zipfile's CRC-32 check, so do it here over
+                # the copied range (served from the page cache just read)
+                source.seek(data_offset)
+                crc = 0
+                remaining = info.file_size
+                while remaining > 0:
+                    chunk = source.read(min(remaining, 1024 * 1024))
+                    if not chunk:
+                        raise zipfile.BadZipFile(f"Truncated member {member}")
+                    crc = zlib.crc32(chunk, crc)
+                    remaining -= len(chunk)
+                if crc != info.CRC:
+                    raise zipfile.BadZipFile(f"Bad CRC-32 for member {member}")
+                return
+
+    with zip_ref.open(member) as source:
+        shutil.copyfileobj(source, target, length=1024 * 1024)
 
 
 def extract_zip_files(input_dir: Path) -> list:
@@ -127,7 +272,7 @@ def extract_zip_files(input_dir: Path) -> list:
     Returns:
         List of extracted CSV file paths
     """
-    zip_files = list(input_dir.glob('BHCF*.zip')) + list(input_dir.glob('bhcf*.zip'))
+    zip_files = list_matching_files(input_dir, BHCF_ZIP_PATTERN)
 
     if not zip_files:
         return []
@@ -138,7 +283,7 @@ def extract_zip_files(input_dir: Path) -> list:
         try:
             # Extract quarter info from ZIP filename
             # Format: BHCF20210630.zip -> bhcf2106.csv
-            match = re.search(r'bhcf(\d{4})(\d{2})(\d{2})', zip_path.name.lower())
+            match = BHCF_ZIP_PATTERN.match(zip_path.name)
 
             if not match:
                 print(f"Skipping {zip_path.name}: Cannot parse filename")
@@ -169,27 +314,33 @@ def extract_zip_files(input_dir: Path) -> list:
             print(f"Extracting {zip_path.name}...")
             with zipfile.ZipFile(zip_path, 'r') as zip_ref:
                 # Find the BHCF TXT file (case-insensitive)
-                bhcf_file = None
-                for file in zip_ref.namelist():
-                    if file.upper().startswith('BHCF') and file.upper().endswith('.TXT'):
-                        bhcf_file = file
-                        break
+                bhcf_file = next(
+                    (name for name in zip_ref.namelist() if BHCF_TXT_PATTERN.match(name)),
+                    None
+                )
 
                 if not bhcf_file:
                     print(f"  WARNING: No BHCF*.TXT file found in {zip_path.name}")
                     continue
 
-                # Extract and rename to .csv
-                with zip_ref.open(bhcf_file) as source:
-                    with open(csv_path, 'wb') as target:
-                        target.write(source.read())
+                # Extract and rename to .csv, streaming through a temp name so
+                # a failed or corrupt extraction (CRC errors surface only at
+                # the end) never leaves a partial CSV that later runs skip
+                part_path = csv_path.with_name(csv_filename + '.part')
+                try:
+                    with open(part_path, 'wb') as target:
+                        copy_zip_member(zip_ref, bhcf_file, target)
+                except BaseException:
+                    part_path.unlink(missing_ok=True)
+                    raise
+                part_path.replace(csv_path)
 
                 csv_size_mb = csv_path.stat().st_size / (1024 * 1024)
                 print(f"  Extracted to {csv_filename} ({csv_size_mb:.2f} MB)")
                 extracted_files.append(csv_path)
 
-        except zipfile.BadZipFile:
-            print(f"ERROR: {zip_path.name} is not a valid ZIP file")
+        except zipfile.BadZipFile as e:
+            print(f"ERROR: {zip_path.name} is not a valid ZIP file ({e})")
         except Exception as e:
             print(f"ERROR extracting {zip_path.name}: {e}")
 
@@ -208,7 +359,7 @@ def extract_quarter_from_filename(filename):
         Tuple of (year, quarter, quarter_str) or (None, None, None)
     """
     # Match bhcfYYQQ pattern
-    match = re.search(r'bhcf(\d{2})(\d{2})', filename.lower())
+    match = QUARTER_PATTERN.search(filename)
 
     if not match:
         return None, None, None
@@ -232,7 +383,35 @@ def extract_quarter_from_filename(filename):
     return year, quarter, quarter_str
 
 
-def process_fry9c_csv(csv_path):
+def dedupe_column_names(column_names: list) -> list:
+    """
+    Make repeated column names unique with pandas' ".1", ".2" suffix rule.
+
+    Args:
+        column_names: Column names, in file order
+
+    Returns:
+        List of names where the second occurrence of a name becomes
+        "NAME.1", the third "NAME.2", and so on
+    """
+    # Same rule as pandas.read_csv: a suffix already used by another
+    # header name is skipped
+    taken = set(column_names)
+    counts = {}
+    unique_names = []
+    for name in column_names:
+        count = counts.get(name, 0)
+        unique_name = name
+        while count > 0:
+            counts[name] = count + 1
+            unique_name = f"{name}.{count}"
+            count = count + 1 if unique_name in taken else counts.get(unique_name, 0)
+        unique_names.append(unique_name)
+        counts[unique_name] = counts.get(unique_name, 0) + 1
+    return unique_names
+
+
+def process_fry9c_csv(csv_path, reporting_period):
     """
     Parse FR Y-9C CSV file and split by filer type.
 
@@ -247,174 +426,260 @@ def process_fry9c_csv(csv_path):
 
     Args:
         csv_path: Path to CSV file
+        reporting_period: Quarter end date (pd.Timestamp) for REPORTING_PERIOD
 
     Returns:
-        Dictionary with keys 'y_9c', 'y_9lp', 'y_9sp' containing DataFrames
-        Each DataFrame contains only relevant columns for that filer type
+        Dictionary with keys 'y_9c', 'y_9lp', 'y_9sp' containing Arrow tables
+        Each table contains only relevant columns for that filer type
     """
-    # Auto-detect delimiter
+    # Auto-detect delimiter and read the header row
     # Chicago Fed files (pre-2021 Q2) use comma
     # FFIEC files (2021 Q2+) use caret ^
-    with open(csv_path, 'r', encoding='utf-8', errors='ignore') as f:
+    with open(csv_path, 'r', encoding='utf-8-sig', errors='ignore', newline='') as f:
         first_line = f.readline()
         delimiter = '^' if '^' in first_line else ','
-
-    # Read CSV with detected delimiter
-    # Try UTF-8 first, fallback to latin-1 for older files
-    # If parsing errors occur, skip bad lines
-    try:
-        df = pd.read_csv(csv_path, delimiter=delimiter, low_memory=False, dtype=str, encoding='utf-8')
-    except UnicodeDecodeError:
-        df = pd.read_csv(csv_path, delimiter=delimiter, low_memory=False, dtype=str, encoding='latin-1')
-    except pd.errors.ParserError:
-        # Some files have malformed rows - skip them (python engine doesn't support low_memory)
-        df = pd.read_csv(csv_path, delimiter=delimiter, dtype=str, encoding='latin-1',
-                        on_bad_lines='skip', engine='python')
-
-    # Remove separator row (second row with "--------")
-    if len(df) > 0:
-        # Check first column for separator
-        first_col = df.columns[0]
-        df = df[df[first_col] != '--------']
-
-    # Ensure uppercase column names
-    df.columns = [str(col).upper().strip() for col in df.columns]
-
-    # Rename RSSD9001 to RSSD_ID for consistency
-    if 'RSSD9001' in df.columns:
-        df = df.rename(columns={'RSSD9001': 'RSSD_ID'})
-    elif 'RSSD_ID' not in df.columns:
+        header = next(csv.reader([first_line], delimiter=delimiter), [])
+
+    # Ensure uppercase column names; rename RSSD9001 to RSSD_ID for consistency.
+    # The standardized names are given to the reader directly, so columns
+    # never need renaming after the read
+    column_names = [str(col).upper().strip() for col in header]
+    if 'RSSD9001' in column_names:
+        column_names = ['RSSD_ID' if c == 'RSSD9001' else c for c in column_names]
+    elif 'RSSD_ID' not in column_names:
         raise ValueError(f"RSSD identifier column not found in {csv_path.name}")
 
-    # Convert RSSD_ID to integer
-    df['RSSD_ID'] = pd.to_numeric(df['RSSD_ID'], errors='coerce')
-    df = df.dropna(subset=['RSSD_ID'])
-    df['RSSD_ID'] = df['RSSD_ID'].astype(int)
-
-    # Add REPORTING_PERIOD from filename
-    filename = csv_path.stem
-    year, quarter, quarter_str = extract_quarter_from_filename(filename)
-
-    if year is None:
-        raise ValueError(f"Could not extract quarter from filename: {filename}")
-
-    # Create reporting period (quarter end date)
-    reporting_period = pd.Timestamp(year=year, month=quarter*3, day=1) + pd.offsets.QuarterEnd(0)
-    df['REPORTING_PERIOD'] = reporting_period
-
-    # Identify columns by prefix
-    # BHCK = FR Y-9C (quarterly filers)
-    # BHCP = FR Y-9LP (quarterly, large/complex)
-    # BHSP = FR Y-9SP (semi-annual, smaller institutions)
-    bhck_cols = [c for c in df.columns if c.startswith('BHCK')]
-    bhcp_cols = [c for c in df.columns if c.startswith('BHCP')]
-    bhsp_cols = [c for c in df.columns if c.startswith('BHSP')]
-
-    # Count non-null values for each prefix per row to determine filer type
-    df['bhck_count'] = df[bhck_cols].notna().sum(axis=1)
-    df['bhcp_count'] = df[bhcp_cols].notna().sum(axis=1)
-    df['bhsp_count'] = df[bhsp_cols].notna().sum(axis=1)
-
-    def classify_filer(row):
-        counts = {'FR_Y9C': row['bhck_count'], 'FR_Y9LP': row['bhcp_count'], 'FR_Y9SP': row['bhsp_count']}
-        max_type = max(counts, key=counts.get)
-        if counts[max_type] > 0:
-            return max_type
-        return 'UNKNOWN'
-
-    df['FILER_TYPE'] = df.apply(classify_filer, axis=1)
-    df = df.drop(columns=['bhck_count', 'bhcp_count', 'bhsp_count'])
-
-    # Split by filer type and retain only relevant columns
-    result = {}
+    # Arrow keeps repeated header names as-is, which breaks selecting columns
+    # by name; suffix them the way pandas did (BHCK2170, BHCK2170.1, ...)
+    column_names = dedupe_column_names(column_names)
 
-    # Y-9C filers: keep BHCK columns
-    y9c_df = df[df['FILER_TYPE'] == 'FR_Y9C'].copy()
-    if len(y9c_df) > 0:
-        metadata_cols = ['RSSD_ID', 'REPORTING_PERIOD']
-        relevant_cols = [c for c in bhck_cols if c in y9c_df.columns]
-        y9c_df = y9c_df[metadata_cols + relevant_cols]
-        result['y_9c'] = y9c_df
-
-    # Y-9LP filers: keep BHCP columns
-    y9lp_df = df[df['FILER_TYPE'] == 'FR_Y9LP'].copy()
-    if len(y9lp_df) > 0:
-        metadata_cols = ['RSSD_ID', 'REPORTING_PERIOD']
-        relevant_cols = [c for c in bhcp_cols if c in y9lp_df.columns]
-        y9lp_df = y9lp_df[metadata_cols + relevant_cols]
-        result['y_9lp'] = y9lp_df
-
-    # Y-9SP filers: keep BHSP columns
-    y9sp_df = df[df['FILER_TYPE'] == 'FR_Y9SP'].copy()
-    if len(y9sp_df) > 0:
-        metadata_cols = ['RSSD_ID', 'REPORTING_PERIOD']
-        relevant_cols = [c for c in bhsp_cols if c in y9sp_df.columns]
-        y9sp_df = y9sp_df[metadata_cols + relevant_cols]
-        result['y_9sp'] = y9sp_df
+    # Identify columns by prefix (see FILER_TYPES)
+    prefix_cols = {
+        prefix: [c for c in column_names if c.startswith(prefix)]
+        for prefix in FILER_TYPES.values()
+    }
+
+    # Try UTF-8 first, fallback to latin-1 for older files. Arrow rejects
+    # rows whose field count differs from the header, so if neither read
+    # succeeds, parse a copy with short rows padded instead
+    try:
+        try:
+            filer_blocks = read_filer_blocks(csv_path, delimiter, column_names, prefix_cols)
+        except pa.ArrowInvalid:
+            filer_blocks = read_filer_blocks(
+                csv_path, delimiter, column_names, prefix_cols,
+                encoding='latin-1'
+            )
+    except pa.ArrowInvalid:
+        filer_blocks = read_filer_blocks(
+            pad_short_rows(csv_path, delimiter, len(column_names)),
+            delimiter, column_names, prefix_cols
+        )
+
+    # Concatenate each filer type's blocks once and add REPORTING_PERIOD
+    # (quarter end date, derived from the filename by the caller)
+    result = {}
+    for filer_type, blocks in filer_blocks.items():
+        if not blocks:
+            continue
+        table = pa.concat_tables(blocks)
+        table = table.add_column(
+            1,
+            'REPORTING_PERIOD',
+            pa.array(np.full(table.num_rows, reporting_period.to_datetime64(), dtype='datetime64[ns]'))
+        )
+        result[filer_type] = table
 
     return result
 
 
+def pad_short_rows(csv_path: Path, delimiter: str, num_columns: int) -> io.BytesIO:
+    """
+    Copy a CSV into memory with short rows padded to the header's width.
+
+    The original pandas parser filled the missing trailing fields of short
+    rows with nulls, so they are padded with empty fields here rather than
+    dropped. Rows with more fields than the header can't be aligned to it;
+    they are dropped and reported.
+
+    Args:
+        csv_path: Path to CSV file
+        delimiter: Field delimiter
+        num_columns: Number of fields in the header row
+
+    Returns:
+        UTF-8 copy of the file, header row included
+    """
+    # Try UTF-8 first, fallback to latin-1 for older files
+    for encoding in ('utf-8-sig', 'latin-1'):
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, delimiter=delimiter, lineterminator='\n')
+        dropped = 0
+        try:
+            with open(csv_path, 'r', encoding=encoding, newline='') as f:
+                for fields in csv.reader(f, delimiter=delimiter):
+                    if not fields:
+                        continue
+                    if len(fields) > num_columns:
+                        dropped += 1
+                        continue
+                    writer.writerow(fields + [''] * (num_columns - len(fields)))
+        except UnicodeDecodeError:
+            continue
+        break
+
+    if dropped:
+        print(f"  WARNING: {csv_path.name}: dropped {dropped:,} rows with more than {num_columns} fields")
+
+    return io.BytesIO(buffer.getvalue().encode('utf-8'))
+
+
+def read_filer_blocks(
+    csv_path,
+    delimiter: str,
+    column_names: list,
+    prefix_cols: dict,
+    encoding: str = 'utf8'
+) -> dict:
+    """
+    Stream a quarterly CSV block by block and split each block by filer type.
+
+    Only the current block of the full-width file is held in memory; each
+    filer type keeps just its own columns from every block.
+
+    Args:
+        csv_path: Path to CSV file, or a binary file object with its contents
+        delimiter: Field delimiter
+        column_names: Standardized column names, in file order (the
+            file's own header row is skipped)
+        prefix_cols: Mapping of variable prefix to its columns
+        encoding: File encoding
+
+    Returns:
+        Dictionary mapping filer type to a list of Arrow tables
+        (RSSD_ID plus that filer type's columns)
+    """
+    # Arrow's streaming reader, keeping every field as a string (nulls for
+    # empty fields) so values are preserved as-is
+    reader = pv.open_csv(
+        csv_path,
+        read_options=pv.ReadOptions(
+            column_names=column_names,
+            skip_rows=1,
+            block_size=CSV_BLOCK_SIZE,
+            encoding=encoding
+        ),
+        parse_options=pv.ParseOptions(delimiter=delimiter),
+        convert_options=pv.ConvertOptions(
+            column_types={name: pa.string() for name in column_names},
+            strings_can_be_null=True
+        )
+    )
+
+    filer_blocks = {filer_type: [] for filer_type in FILER_TYPES}
+
+    for batch in reader:
+        table = pa.Table.from_batches([batch])
+
+        # Remove separator row (second row with "--------")
+        if table.num_columns > 0:
+            # Check first column for separator
+            table = table.filter(pc.fill_null(pc.not_equal(table.column(0), '--------'), True))
+
+        # Convert RSSD_ID to integer, dropping rows without a numeric identifier
+        # (e.g. trailing notes). Cast in Arrow rather than round-tripping
+        # through pandas; decimals like "1234.0" are truncated as before
+        rssd_text = pc.utf8_trim_whitespace(table.column('RSSD_ID'))
+        valid = pc.fill_null(pc.match_substring_regex(rssd_text, r'^\d+(\.\d*)?$'), False)
+        table = table.filter(valid)
+        table = table.set_column(
+            table.schema.get_field_index('RSSD_ID'),
+            'RSSD_ID',
+            pc.cast(pc.cast(rssd_text.filter(valid), pa.float64()), pa.int64(), safe=False)
+        )
+
+        # Count non-null values for each prefix per row to determine filer type.
+        # One validity pass over all prefixed columns, then sum each prefix's slice
+        all_prefix_cols = [c for cols in prefix_cols.values() for c in cols]
+        notna = np.zeros((table.num_rows, len(all_prefix_cols)), dtype=bool)
+        for i, col in enumerate(all_prefix_cols):
+            notna[:, i] = table.column(col).is_valid().to_numpy(zero_copy_only=False)
+        col_prefix = np.array([c[:4] for c in all_prefix_cols])
+        counts = np.stack([
+            notna[:, np.flatnonzero(col_prefix == prefix)].sum(axis=1)
+            for prefix in prefix_cols
+        ], axis=1)
+
+        # Classify each row by the prefix with the most values (vectorized argmax
+        # into FILER_TYPES order; ties go to the first prefix, rows with no
+        # values get -1 and are dropped)
+        filer_index = np.where(counts.max(axis=1) > 0, counts.argmax(axis=1), -1)
+
+        # Split by filer type, keeping only that filer's columns. Projecting the
+        # columns before filtering rows avoids copying every other prefix's data
+        for i, (filer_type, prefix) in enumerate(FILER_TYPES.items()):
+            mask = filer_index == i
+            if mask.any():
+                filer_blocks[filer_type].append(
+                    table.select(['RSSD_ID'] + prefix_cols[prefix]).filter(pa.array(mask))
+                )
+
+    return filer_blocks
+
+
 def process_file_wrapper(args_tuple):
     """
     Wrapper function for parallel processing.
 
+    Run-wide settings (output directory, dictionary, compression) come
+    from init_worker, which must have been called in this process.
+
     Args:
-        args_tuple: (file_path_str, output_dir_str, dict_path_str or None, force)
+        args_tuple: (file_path_str, quarter_str, reporting_period)
 
     Returns:
         Tuple of (status, quarter_str, message)
     """
-    file_path_str, output_dir_str, dict_path_str, force = args_tuple
+    file_path_str, quarter_str, reporting_period = args_tuple
 
     file_path = Path(file_path_str)
-    output_dir = Path(output_dir_str)
-    dict_path = Path(dict_path_str) if dict_path_str else None
+    output_dir = _WORKER_SETTINGS['output_dir']
+    dict_path = _WORKER_SETTINGS['dict_path']
+    compression = _WORKER_SETTINGS['compression']
 
     try:
-        # Extract quarter from filename
-        year, quarter, quarter_str = extract_quarter_from_filename(file_path.name)
-
-        if quarter_str is None:
-            return ('error', None, f"Could not extract quarter from {file_path.name}")
-
-        # Check if all output files already exist (skip unless --force)
-        if not force:
-            all_exist = True
-            for filer_type in ['y_9c', 'y_9lp', 'y_9sp']:
-                output_path = output_dir / filer_type / f"{quarter_str}.parquet"
-                if not output_path.exists():
-                    all_exist = False
-                    break
-            if all_exist:
-                return ('skipped', quarter_str, "All output files already exist (use --force to re-process)")
-
-        # Process CSV - returns dictionary of DataFrames by filer type
-        filer_dfs = process_fry9c_csv(file_path)
-
-        if not filer_dfs:
+        # Process CSV - returns dictionary of Arrow tables by filer type
+        filer_tables = process_fry9c_csv(file_path, reporting_period)
+
+        if not filer_tables:
             return ('error', quarter_str, "No data found for any filer type")
 
-        # Save separate parquet files for each filer type
-        results = []
-        for filer_type, df in filer_dfs.items():
+        # Save separate parquet files for each filer type. The writes are
+        # independent and Arrow releases the GIL while encoding, so they
+        # run concurrently on a small thread pool
+        def write_filer_table(item):
+            filer_type, table = item
+
             # Create subdirectory for filer type
             filer_output_dir = output_dir / filer_type
             filer_output_dir.mkdir(parents=True, exist_ok=True)
 
             # Save parquet file with metadata
             output_path = filer_output_dir / f"{quarter_str}.parquet"
-            write_parquet_with_metadata(df, output_path, dict_path)
+            write_parquet_with_metadata(table, output_path, dict_path, compression)
+
+            return f"{filer_type}: {table.num_rows:,} filers, {table.num_columns-2} vars"
 
-            results.append(f"{filer_type}: {len(df):,} filers, {len(df.columns)-2} vars")
+        with ThreadPoolExecutor(max_workers=len(filer_tables)) as writer_pool:
+            results = list(writer_pool.map(write_filer_table, filer_tables.items()))
 
         message = " | ".join(results)
         return ('success', quarter_str, message)
 
     except Exception as e:
-        import traceback
-        error_msg = f"Error processing {file_path.name}: {str(e)}\n{traceback.format_exc()}"
-        return ('error', None, error_msg)
+        # Keep the traceback short; it is sent back to the main process
+        error_msg = f"Error processing {file_path.name}: {str(e)}\n{traceback.format_exc(limit=5)}"
+        return ('error', quarter_str, error_msg)
 
 
 def main():
@@ -441,6 +706,9 @@ Examples:
   # Re-process all files (ignore existing outputs)
   python 04_parse_data.py --force
 
+  # Write Snappy-compressed parquet instead of zstd
+  python 04_parse_data.py --compression snappy
+
 Features:
   - Automatically extracts BHCF*.zip files to CSV before parsing
   - Handles both manually downloaded ZIPs and automated downloads
@@ -498,6 +766,14 @@ Output Format:
         help='Re-process files even if outputs already exist'
     )
 
+    parser.add_argument(
+        '--compression',
+        type=str,
+        default='zstd',
+        choices=['zstd', 'snappy', 'gzip', 'none'],
+        help='Parquet compression codec (default: zstd)'
+    )
+
     args = parser.parse_args()
 
     # Setup paths
@@ -519,31 +795,45 @@ Output Format:
         print("No ZIP files found to extract\n")
 
     # Find CSV files
-    files_to_process = (
-        list(input_dir.glob('bhcf*.csv')) +
-        list(input_dir.glob('BHCF*.csv'))
-    )
-
-    # Filter by year if specified
+    files_to_process = list_matching_files(input_dir, BHCF_CSV_PATTERN)
+
+    # Parse each filename once: filter by year and derive the quarter and
+    # reporting period (quarter end date) handed to the workers
+    quarters = {}
+    unparsed = []
+    for f in files_to_process:
+        year, quarter, quarter_str = extract_quarter_from_filename(f.name)
+        if year is None:
+            unparsed.append(f)
+            continue
+        if args.start_year and year < args.start_year:
+            continue
+        if args.end_year and year > args.end_year:
+            continue
+        reporting_period = pd.Timestamp(year=year, month=quarter*3, day=1) + pd.offsets.QuarterEnd(0)
+        quarters[f] = (quarter_str, reporting_period)
+
+    # Files with unrecognized names are reported as failures (unless a year
+    # filter is in effect, in which case they are out of range)
     if args.start_year or args.end_year:
-        filtered_files = []
-        for f in files_to_process:
-            year, quarter, quarter_str = extract_quarter_from_filename(f.name)
-            if year is None:
-                continue
-            if args.start_year and year < args.start_year:
-                continue
-            if args.end_year and year > args.end_year:
-                continue
-            filtered_files.append(f)
-        files_to_process = filtered_files
+        unparsed = []
 
-    files_to_process.sort()
+    files_to_process = sorted(quarters)
 
-    if not files_to_process:
+    if not files_to_process and not unparsed:
         print("No CSV files found to process")
         return 1
 
+    # Skip quarters whose output files all exist before dispatching any work
+    # (unless --force), so reruns only parse new quarters
+    skipped = []
+    if not args.force:
+        skipped = [
+            quarters[f][0] for f in files_to_process
+            if all((output_dir / filer_type / f"{quarters[f][0]}.parquet").exists() for filer_type in FILER_TYPES)
+        ]
+        files_to_process = [f for f in files_to_process if quarters[f][0] not in skipped]
+
     # Determine worker count
     if args.no_parallel:
         workers = 1
@@ -552,6 +842,11 @@ Output Format:
     else:
         workers = multiprocessing.cpu_count()
 
+    # Each worker process pays for its start-up and a dictionary load in
+    # init_worker, so never start more than there are files; a single file
+    # is processed in this process without a pool
+    workers = max(1, min(workers, len(files_to_process)))
+
     # Check for data dictionary
     dict_path = output_dir / 'data_dictionary.parquet'
     dict_path_str = str(dict_path) if dict_path.exists() else None
@@ -562,6 +857,8 @@ Output Format:
     print(f"Input directory: {input_dir}")
     print(f"Output directory: {output_dir}")
     print(f"Files to process: {len(files_to_process)}")
+    if skipped:
+        print(f"Already processed: {len(skipped)} (use --force to re-process)")
     print(f"Parallel workers: {workers}")
     if dict_path_str:
         print(f"Data dictionary: {dict_path} (metadata will be applied)")
@@ -573,21 +870,27 @@ Output Format:
 
     # Process files
     successful = []
-    skipped = []
     failed = []
 
-    if workers == 1:
+    for file_path in unparsed:
+        failed.append(file_path.name)
+        print(f"[ERROR] Could not extract quarter from {file_path.name}")
+
+    tasks = [(str(f),) + quarters[f] for f in files_to_process]
+    worker_settings = (str(output_dir), dict_path_str, args.compression)
+
+    if not tasks:
+        print("\nNothing to process")
+    elif workers == 1:
         # Sequential processing
         print("\nProcessing sequentially...")
-        for file_path in files_to_process:
-            status, quarter_str, message = process_file_wrapper((str(file_path), str(output_dir), dict_path_str, args.force))
+        init_worker(*worker_settings)
+        for file_path, task in zip(files_to_process, tasks):
+            status, quarter_str, message = process_file_wrapper(task)
 
             if status == 'success':
                 successful.append(quarter_str)
                 print(f"[{quarter_str}] {message}")
-            elif status == 'skipped':
-                skipped.append(quarter_str)
-                print(f"[{quarter_str}] {message}")
             else:
                 failed.append(quarter_str if quarter_str else file_path.name)
                 print(f"[ERROR] {message}")
@@ -596,11 +899,20 @@ Output Format:
         # Parallel processing
         print(f"\nProcessing in parallel with {workers} workers...")
 
-        with ProcessPoolExecutor(max_workers=workers) as executor:
+        # Fork workers on Linux so they start without re-importing pandas and
+        # pyarrow (other platforms keep their default start method)
+        mp_context = multiprocessing.get_context('fork') if sys.platform.startswith('linux') else None
+
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=mp_context,
+            initializer=init_worker,
+            initargs=worker_settings
+        ) as executor:
             # Submit all tasks
             future_to_file = {
-                executor.submit(process_file_wrapper, (str(f), str(output_dir), dict_path_str, args.force)): f
-                for f in files_to_process
+                executor.submit(process_file_wrapper, task): f
+                for f, task in zip(files_to_process, tasks)
             }
 
             # Process results as they complete
@@ -615,9 +927,6 @@ Output Format:
                     if status == 'success':
                         successful.append(quarter_str)
                         print(f"[{quarter_str}] {message}")
-                    elif status == 'skipped':
-                        skipped.append(quarter_str)
-                        print(f"[{quarter_str}] {message}")
                     else:
                         failed.append(quarter_str if quarter_str else file_path.name)
                         print(f"[ERROR] {message}")
@@ -16,45 +16,129 @@ Usage:
     python 05_summarize.py --no-parallel
 """
 
-import pandas as pd
+import numpy as np
+import pyarrow.parquet as pq
 import argparse
+import calendar
+import json
+import os
 import sys
+import time
+from datetime import datetime
 from pathlib import Path
-from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import multiprocessing
 
 
+# Per-file results from earlier runs, stored in the input directory and
+# reused while a file's size and mtime are unchanged
+SUMMARY_CACHE_NAME = '.summarize_cache.json'
+
+# Minimum seconds between parallel progress lines
+PROGRESS_INTERVAL = 0.5
+
+# Fields of each per-file result (the keys analyze_file returns) and the
+# array dtype each is collected into
+SUMMARY_FIELDS = {
+    'quarter': object,
+    'date': object,
+    'filer_type': object,
+    'filers': 'int64',
+    'variables': 'int64',
+    'total_columns': 'int64',
+    'size_mb': 'float64',
+    'file': object,
+}
+
+
+def load_summary_cache(cache_path):
+    """
+    Load cached per-file results, or an empty cache if missing or unreadable.
+
+    Args:
+        cache_path: Path to the cache file
+
+    Returns:
+        Dictionary of "filer_type/file" -> {'mtime_ns', 'size', 'result'}
+    """
+    try:
+        with open(cache_path) as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return cache if isinstance(cache, dict) else {}
+
+
+def save_summary_cache(cache_path, cache):
+    """
+    Write the cache atomically (temp file, then rename); failures only warn.
+
+    Args:
+        cache_path: Path to the cache file
+        cache: Dictionary as returned by load_summary_cache
+    """
+    tmp_path = cache_path.with_name(cache_path.name + '.tmp')
+    try:
+        with open(tmp_path, 'w') as f:
+            json.dump(cache, f, default=str)
+        tmp_path.replace(cache_path)
+    except OSError as e:
+        print(f"Warning: could not write summary cache {cache_path}: {e}")
+
+
+@lru_cache(maxsize=None)
+def quarter_end_date(quarter_str):
+    """
+    Quarter-end date for a quarter string, computed once per quarter.
+
+    Args:
+        quarter_str: Quarter in YYYYQn form (e.g., "2021Q1")
+
+    Returns:
+        datetime of the last day of the quarter
+    """
+    year = int(quarter_str[:4])
+    month = int(quarter_str[5]) * 3
+    return datetime(year, month, calendar.monthrange(year, month)[1])
+
+
 def analyze_file(args_tuple):
     """
     Analyze a single parquet file.
 
     Args:
-        args_tuple: (file_path_str, filer_type)
+        args_tuple: (file_path_str, filer_type, file_size) with the file size
+            in bytes as found when listing the directory
 
     Returns:
         Dictionary with file info or None if error
     """
-    file_path_str, filer_type = args_tuple
+    file_path_str, filer_type, file_size = args_tuple
     file_path = Path(file_path_str)
 
     try:
-        # Read parquet file
-        df = pd.read_parquet(file_path)
+        # Row and column counts come from the parquet footer; no data pages
+        # are decoded. Memory-mapped, so the one column read below is served
+        # from the page cache without an extra copy; pre-buffering is off so
+        # that read isn't coalesced into a heap buffer first
+        parquet_file = pq.ParquetFile(file_path, memory_map=True, pre_buffer=False)
+        num_rows = parquet_file.metadata.num_rows
+        column_names = parquet_file.schema_arrow.names
+        num_columns = len(column_names)
 
         # Extract quarter from filename (e.g., "2021Q1.parquet")
         quarter_str = file_path.stem
 
-        # Get reporting period
-        if 'REPORTING_PERIOD' in df.columns:
-            reporting_period = df['REPORTING_PERIOD'].iloc[0]
+        # Get reporting period from the first row (reading just that column)
+        if 'REPORTING_PERIOD' in column_names and num_rows > 0:
+            column = parquet_file.read_row_group(0, columns=['REPORTING_PERIOD']).column(0)
+            reporting_period = column[0].as_py()
         else:
-            # Parse from filename as fallback
-            year = int(quarter_str[:4])
-            quarter = int(quarter_str[5])
-            reporting_period = pd.Timestamp(year=year, month=quarter*3, day=1) + pd.offsets.QuarterEnd(0)
+            # Parse from filename as fallback (shared by all filer types)
+            reporting_period = quarter_end_date(quarter_str)
 
-        # Get file size
-        file_size_mb = file_path.stat().st_size / (1024 * 1024)
+        file_size_mb = file_size / (1024 * 1024)
 
         # Count metadata columns (RSSD_ID, REPORTING_PERIOD)
         metadata_cols = 2
@@ -63,9 +147,9 @@ def analyze_file(args_tuple):
             'quarter': quarter_str,
             'date': reporting_period,
             'filer_type': filer_type,
-            'filers': len(df),
-            'variables': len(df.columns) - metadata_cols,
-            'total_columns': len(df.columns),
+            'filers': num_rows,
+            'variables': num_columns - metadata_cols,
+            'total_columns': num_columns,
             'size_mb': file_size_mb,
             'file': file_path.name,
         }
@@ -90,6 +174,9 @@ Examples:
   # Use custom directory
   python 05_summarize.py --input-dir /path/to/parquet
 
+  # Re-read every file (ignore results cached from earlier runs)
+  python 05_summarize.py --no-cache
+
 Note: Expects subdirectories y_9c/, y_9lp/, y_9sp/ under input directory
         """
     )
@@ -105,7 +192,7 @@ Note: Expects subdirectories y_9c/, y_9lp/, y_9sp/ under input directory
         '--workers',
         type=int,
         default=None,
-        help='Number of parallel workers (default: all CPUs)'
+        help='Number of parallel workers (default: 4x CPUs, at most 16)'
     )
 
     parser.add_argument(
@@ -114,6 +201,12 @@ Note: Expects subdirectories y_9c/, y_9lp/, y_9sp/ under input directory
         help='Disable parallel processing'
     )
 
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help=f'Re-read every file instead of reusing unchanged results from {SUMMARY_CACHE_NAME}'
+    )
+
 
     args = parser.parse_args()
 
@@ -127,12 +220,22 @@ Note: Expects subdirectories y_9c/, y_9lp/, y_9sp/ under input directory
     # Find parquet files in subdirectories (y_9c, y_9lp, y_9sp)
     filer_types = ['y_9c', 'y_9lp', 'y_9sp']
     files_to_process = []
+    file_stats = {}  # "filer_type/file" -> (mtime_ns, size), for the cache
 
     for filer_type in filer_types:
         filer_dir = input_dir / filer_type
         if filer_dir.exists():
-            for pq_file in sorted(filer_dir.glob('*.parquet')):
-                files_to_process.append((str(pq_file), filer_type))
+            # One directory pass; sizes come from the listing, so workers
+            # don't stat each file again
+            with os.scandir(filer_dir) as entries:
+                parquet_files = sorted(
+                    (entry.name, entry.path, entry.stat())
+                    for entry in entries
+                    if entry.name.endswith('.parquet') and entry.is_file()
+                )
+            for name, path, stat in parquet_files:
+                files_to_process.append((path, filer_type, stat.st_size))
+                file_stats[f"{filer_type}/{name}"] = (stat.st_mtime_ns, stat.st_size)
 
     if not files_to_process:
         print(f"No parquet files found in {input_dir}/{{y_9c,y_9lp,y_9sp}}")
@@ -145,60 +248,117 @@ Note: Expects subdirectories y_9c/, y_9lp/, y_9sp/ under input directory
     elif args.workers:
         workers = args.workers
     else:
-        workers = multiprocessing.cpu_count()
+        # Footer reads are I/O-bound and pyarrow releases the GIL, so
+        # oversubscribe the CPUs, up to what a local SSD serves in parallel
+        # (raise --workers for network filesystems)
+        workers = min(16, 4 * multiprocessing.cpu_count())
+
+    # Reuse results for files unchanged since the last run; parquet outputs
+    # are rewritten (new mtime) rather than modified when re-parsed
+    cache_path = input_dir / SUMMARY_CACHE_NAME
+    cache = {} if args.no_cache else load_summary_cache(cache_path)
+    files_to_analyze = []  # (slot, file_args)
+    cached_count = 0
+
+    # One pre-sized array per field, with file i's result written to slot i;
+    # files that fail to analyze are left out through the valid mask
+    columns = {
+        field: np.empty(len(files_to_process), dtype=dtype)
+        for field, dtype in SUMMARY_FIELDS.items()
+    }
+    valid = np.zeros(len(files_to_process), dtype=bool)
+
+    def collect(slot, result):
+        for field, values in columns.items():
+            values[slot] = result[field]
+        valid[slot] = True
+
+    for slot, file_args in enumerate(files_to_process):
+        path, filer_type, _ = file_args
+        mtime_ns, size = file_stats[f"{filer_type}/{Path(path).name}"]
+        entry = cache.get(f"{filer_type}/{Path(path).name}")
+        if entry and entry.get('mtime_ns') == mtime_ns and entry.get('size') == size:
+            result = dict(entry['result'])
+            result['date'] = datetime.fromisoformat(result['date'])
+            collect(slot, result)
+            cached_count += 1
+        else:
+            files_to_analyze.append((slot, file_args))
+
+    # No more workers than files left to read, and none at all for a
+    # handful of files, where starting the pool costs more than it saves
+    workers = max(1, min(workers, len(files_to_analyze)))
+    if len(files_to_analyze) <= 4:
+        workers = 1
 
     print("="*80)
     print("FR Y-9 DATA SUMMARY")
     print("="*80)
     print(f"Directory: {input_dir}")
     print(f"Files found: {len(files_to_process)}")
+    if cached_count:
+        print(f"Unchanged since last run (cached): {cached_count}")
     print(f"Parallel workers: {workers}")
     print("="*80)
 
     # Analyze files
-    results = []
-
-    if workers == 1:
+    if files_to_analyze and workers == 1:
         # Sequential processing
         print("\nAnalyzing files sequentially...")
-        for file_args in files_to_process:
+        for slot, file_args in files_to_analyze:
             result = analyze_file(file_args)
             if result:
-                results.append(result)
+                collect(slot, result)
                 print(f"  Processed {result['filer_type']}/{result['quarter']}")
 
-    else:
+    elif files_to_analyze:
         # Parallel processing
         print(f"\nProcessing files in parallel with {workers} workers...")
 
-        with ProcessPoolExecutor(max_workers=workers) as executor:
-            future_to_file = {
-                executor.submit(analyze_file, f): f
-                for f in files_to_process
+        # Parquet reads run in pyarrow's C++ code with the GIL released, so
+        # threads parallelize them without spawning interpreters or pickling
+        # analyze_file reports its own errors and returns None, so results
+        # are simply consumed in submission order
+        slots = [slot for slot, _ in files_to_analyze]
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            analyzed = executor.map(analyze_file, [file_args for _, file_args in files_to_analyze])
+            last_progress = time.monotonic()
+            for completed, (slot, result) in enumerate(zip(slots, analyzed), 1):
+                if result:
+                    collect(slot, result)
+
+                # Progress update, throttled by time rather than file count
+                now = time.monotonic()
+                if now - last_progress >= PROGRESS_INTERVAL or completed == len(files_to_analyze):
+                    print(f"  Processed {completed}/{len(files_to_analyze)} files...")
+                    last_progress = now
+
+    # Rewrite the cache with exactly the current files (dropping deleted ones)
+    if not args.no_cache:
+        new_cache = {}
+        # tolist() gives plain Python values, which JSON-encode as before
+        for row in zip(*(values[valid].tolist() for values in columns.values())):
+            result = dict(zip(SUMMARY_FIELDS, row))
+            key = f"{result['filer_type']}/{result['file']}"
+            mtime_ns, size = file_stats[key]
+            new_cache[key] = {
+                'mtime_ns': mtime_ns,
+                'size': size,
+                'result': dict(result, date=result['date'].isoformat())
             }
+        if new_cache != cache:
+            save_summary_cache(cache_path, new_cache)
 
-            completed = 0
-            for future in as_completed(future_to_file):
-                completed += 1
-
-                try:
-                    result = future.result()
-                    if result:
-                        results.append(result)
-
-                    # Progress update
-                    if completed % 20 == 0 or completed == len(files_to_process):
-                        print(f"  Processed {completed}/{len(files_to_process)} files...")
-
-                except Exception as e:
-                    print(f"  Error: {e}")
-
-    if not results:
+    if not valid.any():
         print("\nNo valid data found")
         return 1
 
+    # pandas is only needed from here on, so --help and the file scan don't
+    # pay for importing it
+    import pandas as pd
+
     # Create summary DataFrame
-    df_summary = pd.DataFrame(results)
+    df_summary = pd.DataFrame({field: values[valid] for field, values in columns.items()})
     df_summary = df_summary.sort_values(['quarter', 'filer_type'])
 
     # Pivot to show filers by quarter and type
@@ -227,40 +387,53 @@ Note: Expects subdirectories y_9c/, y_9lp/, y_9sp/ under input directory
     print(f"{'':8} {'':12} {'Filers':>7} {'Filers':>7} {'Filers':>7} | {'Vars':>5} {'Vars':>5} {'Vars':>5}")
     print("-" * 8 + " " + "-" * 12 + " " + "-" * 7 + " " + "-" * 7 + " " + "-" * 7 + " | " + "-" * 5 + " " + "-" * 5 + " " + "-" * 5)
 
-    for quarter, row in display_df.iterrows():
-        y9c = f"{row['Y-9C']:,}" if row['Y-9C'] > 0 else "-"
-        y9lp = f"{row['Y-9LP']:,}" if row['Y-9LP'] > 0 else "-"
-        y9sp = f"{row['Y-9SP']:,}" if row['Y-9SP'] > 0 else "-"
-        y9c_v = f"{row['Y-9C_vars']:,}" if row['Y-9C_vars'] > 0 else "-"
-        y9lp_v = f"{row['Y-9LP_vars']:,}" if row['Y-9LP_vars'] > 0 else "-"
-        y9sp_v = f"{row['Y-9SP_vars']:,}" if row['Y-9SP_vars'] > 0 else "-"
-
-        print(f"{quarter:<8} {row['Date'].strftime('%Y-%m-%d'):<12} "
-              f"{y9c:>7} {y9lp:>7} {y9sp:>7} | {y9c_v:>5} {y9lp_v:>5} {y9sp_v:>5}")
+    # Format whole columns at once (counts with thousands separators, zero
+    # as "-") and print the table in one write instead of row by row
+    def format_counts(counts, width):
+        return counts.map(lambda v: f"{v:,}" if v > 0 else "-").str.rjust(width)
+
+    lines = (
+        display_df.index.to_series().str.ljust(8) + " " +
+        display_df['Date'].dt.strftime('%Y-%m-%d').str.ljust(12) + " " +
+        format_counts(display_df['Y-9C'], 7) + " " +
+        format_counts(display_df['Y-9LP'], 7) + " " +
+        format_counts(display_df['Y-9SP'], 7) + " | " +
+        format_counts(display_df['Y-9C_vars'], 5) + " " +
+        format_counts(display_df['Y-9LP_vars'], 5) + " " +
+        format_counts(display_df['Y-9SP_vars'], 5)
+    )
+    print("\n".join(lines))
 
     # Overall statistics
     print("\n" + "="*80)
     print("SUMMARY STATISTICS")
     print("="*80)
     print(f"Total quarters: {len(display_df)}")
-    print(f"Date range: {dates.min().strftime('%Y-%m-%d')} to {dates.max().strftime('%Y-%m-%d')}")
+    date_range = dates.agg(['min', 'max'])
+    print(f"Date range: {date_range['min'].strftime('%Y-%m-%d')} to {date_range['max'].strftime('%Y-%m-%d')}")
     print(f"Total files: {len(df_summary)}")
 
     print(f"\nFiler Type Breakdown:")
-    for filer_type in ['y_9c', 'y_9lp', 'y_9sp']:
-        df_type = df_summary[df_summary['filer_type'] == filer_type]
-        if len(df_type) > 0:
-            filer_names = {
-                'y_9c': 'FR Y-9C',
-                'y_9lp': 'FR Y-9LP',
-                'y_9sp': 'FR Y-9SP'
-            }
-            print(f"  {filer_names[filer_type]:<10} {len(df_type):>3} quarters, "
-                  f"avg {df_type['filers'].mean():>6.0f} filers, "
-                  f"avg {df_type['variables'].mean():>5.0f} vars, "
-                  f"{df_type['size_mb'].sum():>6.1f} MB")
-
-    print(f"\nTotal size: {df_summary['size_mb'].sum():.1f} MB")
+    # One groupby pass instead of re-filtering df_summary per filer type
+    filer_names = {
+        'y_9c': 'FR Y-9C',
+        'y_9lp': 'FR Y-9LP',
+        'y_9sp': 'FR Y-9SP'
+    }
+    by_type = df_summary.groupby('filer_type').agg(
+        quarters=('quarter', 'size'),
+        filers=('filers', 'mean'),
+        variables=('variables', 'mean'),
+        size_mb=('size_mb', 'sum'),
+    ).reindex(list(filer_names)).dropna()
+    for stats in by_type.itertuples():
+        print(f"  {filer_names[stats.Index]:<10} {int(stats.quarters):>3} quarters, "
+              f"avg {stats.filers:>6.0f} filers, "
+              f"avg {stats.variables:>5.0f} vars, "
+              f"{stats.size_mb:>6.1f} MB")
+
+    # Per-type sizes are already summed; no need to scan size_mb again
+    print(f"\nTotal size: {by_type['size_mb'].sum():.1f} MB")
     print("="*80)
 
     return 0
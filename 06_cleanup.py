@@ -8,7 +8,7 @@ Usage:
     # Remove extracted CSVs (keeps ZIPs as source)
     python 06_cleanup.py --extracted
 
-    # Remove all raw files (CSVs and ZIPs)
+    # Remove all raw files (CSVs, ZIPs and partial downloads)
     python 06_cleanup.py --raw
 
     # Remove processed parquet files
@@ -19,11 +19,41 @@ Usage:
 """
 
 import argparse
+import os
 import sys
 import re
 from pathlib import Path
 
 
+# Raw file names: quarterly ZIPs (BHCF20210630.zip) and CSVs (bhcf2106.csv)
+BHCF_ZIP_PATTERN = re.compile(r'^bhcf(\d{4})(\d{2})(\d{2})\.zip$', re.IGNORECASE)
+BHCF_CSV_PATTERN = re.compile(r'^bhcf\d{4}\.csv$', re.IGNORECASE)
+
+# Partial CSVs left by an interrupted download (01: .part, .segments) or
+# ZIP extraction (04: .part)
+BHCF_PARTIAL_PATTERN = re.compile(r'^bhcf\d{4}\.csv\.(part|segments)$', re.IGNORECASE)
+PARQUET_PATTERN = re.compile(r'^.*\.parquet$')
+
+
+def list_matching_files(directory: Path, pattern: re.Pattern) -> list:
+    """
+    List files in a directory whose names match a compiled pattern.
+
+    Args:
+        directory: Directory to scan
+        pattern: Compiled filename pattern
+
+    Returns:
+        List of (path, size in bytes) tuples for matching files
+    """
+    with os.scandir(directory) as entries:
+        return [
+            (Path(entry.path), entry.stat().st_size)
+            for entry in entries
+            if entry.is_file() and pattern.match(entry.name)
+        ]
+
+
 def get_extracted_csvs(raw_dir: Path) -> list:
     """
     Find CSV files that were extracted from ZIPs.
@@ -35,15 +65,15 @@ def get_extracted_csvs(raw_dir: Path) -> list:
         raw_dir: Directory containing raw files
 
     Returns:
-        List of CSV paths that have corresponding ZIPs
+        List of (path, size) tuples for CSVs that have corresponding ZIPs
     """
     extracted = []
 
-    zip_files = list(raw_dir.glob('BHCF*.zip')) + list(raw_dir.glob('bhcf*.zip'))
+    zip_files = list_matching_files(raw_dir, BHCF_ZIP_PATTERN)
 
-    for zip_path in zip_files:
+    for zip_path, _ in zip_files:
         # Extract date from ZIP filename
-        match = re.search(r'bhcf(\d{4})(\d{2})(\d{2})', zip_path.name.lower())
+        match = BHCF_ZIP_PATTERN.match(zip_path.name)
         if not match:
             continue
 
@@ -55,28 +85,29 @@ def get_extracted_csvs(raw_dir: Path) -> list:
         csv_filename = f"bhcf{year_short:02d}{month}.csv"
         csv_path = raw_dir / csv_filename
 
-        if csv_path.exists():
-            extracted.append(csv_path)
+        try:
+            extracted.append((csv_path, csv_path.stat().st_size))
+        except FileNotFoundError:
+            continue
 
     return extracted
 
 
 def get_all_raw_files(raw_dir: Path) -> list:
     """
-    Find all raw data files (CSVs and ZIPs).
+    Find all raw data files (CSVs, ZIPs and partial downloads/extractions).
 
     Args:
         raw_dir: Directory containing raw files
 
     Returns:
-        List of all raw file paths
+        List of (path, size) tuples for all raw files
     """
-    files = []
-    files.extend(raw_dir.glob('bhcf*.csv'))
-    files.extend(raw_dir.glob('BHCF*.csv'))
-    files.extend(raw_dir.glob('bhcf*.zip'))
-    files.extend(raw_dir.glob('BHCF*.zip'))
-    return list(files)
+    return (
+        list_matching_files(raw_dir, BHCF_CSV_PATTERN) +
+        list_matching_files(raw_dir, BHCF_ZIP_PATTERN) +
+        list_matching_files(raw_dir, BHCF_PARTIAL_PATTERN)
+    )
 
 
 def get_processed_files(processed_dir: Path) -> list:
@@ -87,24 +118,25 @@ def get_processed_files(processed_dir: Path) -> list:
         processed_dir: Directory containing processed files
 
     Returns:
-        List of all parquet file paths
+        List of (path, size) tuples for all parquet files
     """
     files = []
     for subdir in ['y_9c', 'y_9lp', 'y_9sp']:
         subdir_path = processed_dir / subdir
         if subdir_path.exists():
-            files.extend(subdir_path.glob('*.parquet'))
+            files.extend(list_matching_files(subdir_path, PARQUET_PATTERN))
     return list(files)
 
 
+# Size units for format_size, largest first
+SIZE_UNITS = [(1024 ** 3, 'GB'), (1024 ** 2, 'MB'), (1024, 'KB')]
+
+
 def format_size(total_bytes: int) -> str:
     """Format bytes as human-readable size."""
-    if total_bytes >= 1024 * 1024 * 1024:
-        return f"{total_bytes / (1024**3):.2f} GB"
-    elif total_bytes >= 1024 * 1024:
-        return f"{total_bytes / (1024**2):.2f} MB"
-    elif total_bytes >= 1024:
-        return f"{total_bytes / 1024:.2f} KB"
+    for factor, unit in SIZE_UNITS:
+        if total_bytes >= factor:
+            return f"{total_bytes / factor:.2f} {unit}"
     return f"{total_bytes} bytes"
 
 
@@ -112,8 +144,10 @@ def delete_files(files: list, dry_run: bool = False) -> tuple:
     """
     Delete files and return statistics.
 
+    Sizes come from the directory listing, so files are not re-statted.
+
     Args:
-        files: List of file paths to delete
+        files: List of (path, size) tuples to delete
         dry_run: If True, don't actually delete
 
     Returns:
@@ -122,14 +156,12 @@ def delete_files(files: list, dry_run: bool = False) -> tuple:
     deleted_count = 0
     total_bytes = 0
 
-    for file_path in files:
-        if file_path.exists():
-            size = file_path.stat().st_size
-            total_bytes += size
+    for file_path, size in files:
+        total_bytes += size
 
-            if not dry_run:
-                file_path.unlink()
-            deleted_count += 1
+        if not dry_run:
+            file_path.unlink(missing_ok=True)
+        deleted_count += 1
 
     return deleted_count, total_bytes
 
@@ -143,7 +175,7 @@ Examples:
   # Remove extracted CSVs only (keeps ZIPs as source)
   python 06_cleanup.py --extracted
 
-  # Remove all raw files (CSVs and ZIPs)
+  # Remove all raw files (CSVs, ZIPs and partial downloads)
   python 06_cleanup.py --raw
 
   # Remove processed parquet files
@@ -166,7 +198,7 @@ Examples:
     parser.add_argument(
         '--raw',
         action='store_true',
-        help='Remove all raw files (CSVs and ZIPs)'
+        help='Remove all raw files (CSVs, ZIPs and partial downloads)'
     )
 
     parser.add_argument(
@@ -224,7 +256,7 @@ Examples:
             files = get_extracted_csvs(raw_dir)
             if files:
                 print(f"\nExtracted CSVs ({len(files)} files):")
-                for f in sorted(files)[:10]:
+                for f, _ in sorted(files)[:10]:
                     print(f"  {f.name}")
                 if len(files) > 10:
                     print(f"  ... and {len(files) - 10} more")
@@ -245,12 +277,15 @@ Examples:
         else:
             files = get_all_raw_files(raw_dir)
             if files:
-                csv_files = [f for f in files if f.suffix.lower() == '.csv']
-                zip_files = [f for f in files if f.suffix.lower() == '.zip']
+                csv_files = [f for f, _ in files if f.suffix.lower() == '.csv']
+                zip_files = [f for f, _ in files if f.suffix.lower() == '.zip']
+                partial_files = [f for f, _ in files if BHCF_PARTIAL_PATTERN.match(f.name)]
 
                 print(f"\nAll raw files ({len(files)} files):")
                 print(f"  CSV files: {len(csv_files)}")
                 print(f"  ZIP files: {len(zip_files)}")
+                if partial_files:
+                    print(f"  Partial files: {len(partial_files)}")
 
                 count, size = delete_files(files, args.dry_run)
                 total_deleted += count
@@ -270,7 +305,7 @@ Examples:
             if files:
                 print(f"\nProcessed parquet files ({len(files)} files):")
                 for subdir in ['y_9c', 'y_9lp', 'y_9sp']:
-                    subdir_files = [f for f in files if f.parent.name == subdir]
+                    subdir_files = [f for f, _ in files if f.parent.name == subdir]
                     if subdir_files:
                         print(f"  {subdir}/: {len(subdir_files)} files")
 
@@ -0,0 +1,86 @@
+"""
+Tests for 04_parse_data.py.
+
+Run from the repository root:
+    python -m unittest discover tests
+"""
+
+import importlib.util
+import tempfile
+import unittest
+import zipfile
+from pathlib import Path
+
+import pandas as pd
+
+
+# Script names start with a digit, so load the module from its path
+_SCRIPT = Path(__file__).resolve().parent.parent / '04_parse_data.py'
+_spec = importlib.util.spec_from_file_location('parse_data', _SCRIPT)
+parse_data = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(parse_data)
+
+
+class DuplicateHeaderTest(unittest.TestCase):
+    """Repeated header names are suffixed like pandas.read_csv did."""
+
+    def test_dedupe_column_names(self):
+        self.assertEqual(
+            parse_data.dedupe_column_names(['RSSD_ID', 'BHCK2170', 'BHCK2170', 'BHCK2170']),
+            ['RSSD_ID', 'BHCK2170', 'BHCK2170.1', 'BHCK2170.2']
+        )
+        # A suffix already used by another header name is skipped
+        self.assertEqual(
+            parse_data.dedupe_column_names(['A', 'A.1', 'A']),
+            ['A', 'A.1', 'A.2']
+        )
+
+    def test_repeated_header_keeps_quarter(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            csv_path = Path(tmp) / 'bhcf2109.csv'
+            csv_path.write_text(
+                'RSSD9001^BHCK2170^BHCK2170^BHSP0001\n'
+                '1^5^6^\n'
+                '2^^^9\n'
+            )
+            tables = parse_data.process_fry9c_csv(csv_path, pd.Timestamp('2021-09-30'))
+
+        self.assertEqual(sorted(tables), ['y_9c', 'y_9sp'])
+        self.assertEqual(
+            tables['y_9c'].column_names,
+            ['RSSD_ID', 'REPORTING_PERIOD', 'BHCK2170', 'BHCK2170.1']
+        )
+        self.assertEqual(tables['y_9c'].column('BHCK2170.1').to_pylist(), ['6'])
+        self.assertEqual(tables['y_9sp'].column('RSSD_ID').to_pylist(), [2])
+
+
+class ZipExtractionTest(unittest.TestCase):
+    """Stored ZIP members are extracted only if they pass the CRC check."""
+
+    DATA = b'RSSD9001^BHCK0001\n' + b''.join(b'%d^%d\n' % (i, i) for i in range(1, 1000))
+
+    def write_zip(self, directory, corrupt=False):
+        zip_path = Path(directory) / 'BHCF20210930.zip'
+        with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_STORED) as zip_ref:
+            zip_ref.writestr('BHCF20210930.txt', self.DATA)
+        if corrupt:
+            contents = bytearray(zip_path.read_bytes())
+            contents[contents.index(b'500^500')] = ord('6')
+            zip_path.write_bytes(contents)
+
+    def test_stored_member_extracted(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            self.write_zip(tmp)
+            extracted = parse_data.extract_zip_files(Path(tmp))
+            self.assertEqual([p.name for p in extracted], ['bhcf2109.csv'])
+            self.assertEqual((Path(tmp) / 'bhcf2109.csv').read_bytes(), self.DATA)
+
+    def test_corrupt_stored_member_not_extracted(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            self.write_zip(tmp, corrupt=True)
+            self.assertEqual(parse_data.extract_zip_files(Path(tmp)), [])
+            self.assertEqual(sorted(p.name for p in Path(tmp).iterdir()), ['BHCF20210930.zip'])
+
+
+if __name__ == '__main__':
+    unittest.main()